@@ -5,7 +5,9 @@ from __future__ import annotations
 import difflib
 import json
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -856,18 +858,22 @@ def compile_spec(input_path: Path, vocab: Vocab, project_root: Path | None = Non
         ir_path = ir_dir / f"{slug}.json"
         diff_path = roundtrip_dir / f"{slug}.diff.txt"
 
+        source_text = input_path.read_text()
+        from_name = _display_path(input_path, project_root)
+        to_name = _display_path(canonical_path, project_root)
+        diff_text = _unified_diff(source_text, canonical_gwt, from_name, to_name)
         dal_path.write_text(dal_text)
         canonical_path.write_text(canonical_gwt)
         ir_path.write_text(serialize_ir_json(ir))
-        from_name = _display_path(input_path, project_root)
-        to_name = _display_path(canonical_path, project_root)
-        diff_path.write_text(_unified_diff(input_path.read_text(), canonical_gwt, from_name, to_name))
-
-        canonical_ir = parse_gwt(canonical_path, vocab)
-        if canonical_ir.to_dict() != ir.to_dict():
-            raise DualSpecError(
-                f"Roundtrip gate failed: IR mismatch for {input_path} vs {canonical_path}"
-            )
+        diff_path.write_text(diff_text)
+
+        # Identical text parses to an identical IR, so only re-parse when they differ.
+        if source_text != canonical_gwt:
+            canonical_ir = parse_gwt(canonical_path, vocab)
+            if canonical_ir.to_dict() != ir.to_dict():
+                raise DualSpecError(
+                    f"Roundtrip gate failed: IR mismatch for {input_path} vs {canonical_path}"
+                )
 
         outputs.update({
             "dal": dal_path,
@@ -913,6 +919,13 @@ def _display_path(path: Path, project_root: Path) -> str:
         return str(path)
 
 
+_VIOLATION_MESSAGES = {
+    "token": "Implementation token '{}' is banned",
+    "identifier": "Implementation identifier '{}' is banned",
+    "regex": "Implementation pattern matched: {}",
+}
+
+
 def check_specs(target: Path, vocab: Vocab) -> list[SpecViolation]:
     """Run implementation leakage checks from vocab lints."""
     lint = vocab.lints["implementation_leakage"]
@@ -921,6 +934,11 @@ def check_specs(target: Path, vocab: Vocab) -> list[SpecViolation]:
     allowed_contextual: set[str] = set(lint.get("allowed_contextual_tokens", []))
 
     regexes = [re.compile(p) for p in banned_regex]
+    token_patterns = [
+        re.compile(rf"\b{re.escape(token)}\b", re.IGNORECASE)
+        for token in banned_tokens
+        if token.lower() not in allowed_contextual
+    ]
     identifier_regex = re.compile(
         r"\b[A-Za-z_]*(service|repository|controller|dao|orm|method|function|class)\b",
         re.IGNORECASE,
@@ -928,58 +946,59 @@ def check_specs(target: Path, vocab: Vocab) -> list[SpecViolation]:
 
     files = _collect_spec_files(target)
     violations: list[SpecViolation] = []
+    seen: set[tuple[str, int, int, str, str]] = set()
+    file_name = ""
+    line_no = 0
+    line = ""
+    # Computed lazily on the first match of each line and shared by its violations.
+    suggestion: str | None = None
+
+    def emit(kind: str, match: re.Match[str], detail: str) -> None:
+        nonlocal suggestion
+        key = (file_name, line_no, match.start() + 1, kind, match.group(0))
+        if key in seen:
+            return
+        seen.add(key)
+        if suggestion is None:
+            suggestion = _suggest_rewrite(line)
+        violations.append(
+            SpecViolation(
+                file=file_name,
+                line=line_no,
+                column=key[2],
+                kind=kind,
+                matched=key[4],
+                message=_VIOLATION_MESSAGES[kind].format(detail),
+                suggestion=suggestion,
+            )
+        )
 
     for file_path in files:
-        for line_no, raw in enumerate(file_path.read_text().splitlines(), start=1):
-            if not raw.strip() or raw.strip().startswith(";"):
+        file_name = str(file_path)
+        for line_no, line in _iter_spec_lines(file_path):
+            if not line.strip() or line.strip().startswith(";"):
                 continue
-            line = raw.rstrip("\n")
+            suggestion = None
 
-            for token in banned_tokens:
-                if token.lower() in allowed_contextual:
-                    continue
-                pattern = re.compile(rf"\b{re.escape(token)}\b", re.IGNORECASE)
+            for pattern in token_patterns:
                 for match in pattern.finditer(line):
-                    violations.append(
-                        SpecViolation(
-                            file=str(file_path),
-                            line=line_no,
-                            column=match.start() + 1,
-                            kind="token",
-                            matched=match.group(0),
-                            message=f"Implementation token '{match.group(0)}' is banned",
-                            suggestion=_suggest_rewrite(line),
-                        )
-                    )
+                    emit("token", match, match.group(0))
 
             for match in identifier_regex.finditer(line):
-                violations.append(
-                    SpecViolation(
-                        file=str(file_path),
-                        line=line_no,
-                        column=match.start() + 1,
-                        kind="identifier",
-                        matched=match.group(0),
-                        message=f"Implementation identifier '{match.group(0)}' is banned",
-                        suggestion=_suggest_rewrite(line),
-                    )
-                )
+                emit("identifier", match, match.group(0))
 
             for pattern in regexes:
                 for match in pattern.finditer(line):
-                    violations.append(
-                        SpecViolation(
-                            file=str(file_path),
-                            line=line_no,
-                            column=match.start() + 1,
-                            kind="regex",
-                            matched=match.group(0),
-                            message=f"Implementation pattern matched: {pattern.pattern}",
-                            suggestion=_suggest_rewrite(line),
-                        )
-                    )
+                    emit("regex", match, pattern.pattern)
+
+    return violations
+
 
-    return _dedupe_violations(violations)
+def _iter_spec_lines(file_path: Path) -> Iterator[tuple[int, str]]:
+    """Stream (line number, line) pairs so large specs are never held in memory."""
+    with file_path.open(encoding="utf-8") as fh:
+        for line_no, raw in enumerate(fh, start=1):
+            yield line_no, raw.rstrip("\n")
 
 
 def _collect_spec_files(target: Path) -> list[Path]:
@@ -992,6 +1011,7 @@ def _collect_spec_files(target: Path) -> list[Path]:
     return files
 
 
+@lru_cache(maxsize=2048)
 def _suggest_rewrite(line: str) -> str:
     lower = line.lower()
     if "userservice" in lower or "repository" in lower or "user_repository" in lower:
@@ -1001,18 +1021,6 @@ def _suggest_rewrite(line: str) -> str:
     return "Rewrite this line as behavioral intent without implementation details."
 
 
-def _dedupe_violations(violations: list[SpecViolation]) -> list[SpecViolation]:
-    seen: set[tuple[str, int, int, str, str]] = set()
-    deduped: list[SpecViolation] = []
-    for violation in violations:
-        key = (violation.file, violation.line, violation.column, violation.kind, violation.matched)
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(violation)
-    return deduped
-
-
 def load_feature_ir(path: Path) -> FeatureIR:
     """Load feature IR JSON written by compile_spec."""
     data = json.loads(path.read_text())
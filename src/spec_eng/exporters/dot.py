@@ -4,19 +4,28 @@ from __future__ import annotations
 
 from spec_eng.models import GraphModel
 
+_DOT_TRANS = str.maketrans({'"': '\\"', "\n": "\\n"})
+
 
 def export_dot(graph: GraphModel) -> str:
     """Export a GraphModel as a Graphviz DOT string."""
     lines = ["digraph spec_state_machine {", "  rankdir=LR;", ""]
+    escaped: dict[str, str] = {}
+
+    def esc(text: str) -> str:
+        value = escaped.get(text)
+        if value is None:
+            value = escaped[text] = _escape(text)
+        return value
 
     # Entry points: double circle
     if graph.entry_points:
-        entry_ids = " ".join(f'"{_escape(s)}"' for s in graph.entry_points)
+        entry_ids = " ".join(f'"{esc(s)}"' for s in graph.entry_points)
         lines.append(f"  node [shape=doublecircle]; {entry_ids};")
 
     # Terminal states: bold box
     if graph.terminal_states:
-        terminal_ids = " ".join(f'"{_escape(s)}"' for s in graph.terminal_states)
+        terminal_ids = " ".join(f'"{esc(s)}"' for s in graph.terminal_states)
         lines.append(f"  node [shape=box, style=bold]; {terminal_ids};")
 
     # Default shape for other nodes
@@ -25,9 +34,9 @@ def export_dot(graph: GraphModel) -> str:
 
     # Edges
     for t in graph.transitions:
-        from_s = _escape(t.from_state)
-        to_s = _escape(t.to_state)
-        event = _escape(t.event)
+        from_s = esc(t.from_state)
+        to_s = esc(t.to_state)
+        event = esc(t.event)
         lines.append(f'  "{from_s}" -> "{to_s}" [label="{event}"];')
 
     lines.append("}")
@@ -36,4 +45,4 @@ def export_dot(graph: GraphModel) -> str:
 
 def _escape(text: str) -> str:
     """Escape a string for DOT format."""
-    return text.replace('"', '\\"').replace("\n", "\\n")
+    return text.translate(_DOT_TRANS)
@@ -216,7 +216,7 @@ def load_gaps(project_root: Path) -> list[Gap]:
     if not path.exists():
         return []
 
-    data = json.loads(path.read_text())
+    data = json.loads(path.read_bytes())  # json detects UTF-8; skip the text decode layer
     return [
         Gap(
             gap_type=GapType(g["gap_type"]),
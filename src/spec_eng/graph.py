@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import weakref
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 import networkx as nx
 
 from spec_eng.models import GraphModel, ParseResult, Scenario, State, Transition
 
+# Articles and common filler words ignored when comparing state labels
+_STOP = frozenset({"a", "an", "the", "is", "are", "has", "have", "there"})
+
+# NetworkX views of graphs whose cycles were computed, keyed by id() of the
+# GraphModel and dropped when it is garbage collected. Never mutated in place.
+_NX_VIEWS: dict[int, nx.DiGraph] = {}
+
 
 def extract_states_and_transitions(
     scenario: Scenario,
@@ -47,29 +56,29 @@ def extract_states_and_transitions(
     return states, transitions
 
 
-def build_graph(parse_result: ParseResult) -> GraphModel:
-    """Build a GraphModel from parsed scenarios."""
-    all_states: dict[str, State] = {}
+def build_graph(parse_result: ParseResult, detect_cycles: bool = True) -> GraphModel:
+    """Build a GraphModel from parsed scenarios.
+
+    Pass ``detect_cycles=False`` to skip cycle enumeration when the caller
+    does not need ``GraphModel.cycles``.
+    """
+    sources: dict[str, set[str]] = {}
     all_transitions: list[Transition] = []
 
     for scenario in parse_result.scenarios:
         states, transitions = extract_states_and_transitions(scenario)
 
         for state in states:
-            if state.label in all_states:
-                # Merge source scenarios
-                existing = all_states[state.label]
-                merged_sources = tuple(
-                    sorted(set(existing.source_scenarios + state.source_scenarios))
-                )
-                all_states[state.label] = State(
-                    label=state.label, source_scenarios=merged_sources
-                )
-            else:
-                all_states[state.label] = state
+            sources.setdefault(state.label, set()).update(state.source_scenarios)
 
         all_transitions.extend(transitions)
 
+    # Materialize each state once, after all source scenarios are merged
+    all_states = {
+        label: State(label=label, source_scenarios=tuple(sorted(srcs)))
+        for label, srcs in sources.items()
+    }
+
     # Identify entry points: states that appear as GIVEN but never as THEN
     then_labels = {t.to_state for t in all_transitions}
     given_labels = {t.from_state for t in all_transitions}
@@ -78,17 +87,33 @@ def build_graph(parse_result: ParseResult) -> GraphModel:
     # Identify terminal states: states that appear as THEN but never as GIVEN
     terminal_states = sorted(then_labels - given_labels)
 
-    # Detect cycles using networkx
-    nxg = _to_networkx_internal(all_states, all_transitions)
-    cycles = [sorted(c) for c in nx.simple_cycles(nxg)]
+    nxg: nx.DiGraph | None = None
+    cycles: list[list[str]] = []
+    if detect_cycles:
+        nxg = _to_networkx_internal(all_states, all_transitions)
+        cycles = _find_cycles(nxg)
 
-    return GraphModel(
+    graph = GraphModel(
         states=all_states,
         transitions=all_transitions,
         entry_points=entry_points,
         terminal_states=terminal_states,
         cycles=cycles,
     )
+    if nxg is not None:
+        _remember_networkx(graph, nxg)
+    return graph
+
+
+def _remember_networkx(graph: GraphModel, nxg: nx.DiGraph) -> None:
+    key = id(graph)
+    _NX_VIEWS[key] = nxg
+    weakref.finalize(graph, _NX_VIEWS.pop, key, None)
+
+
+def _cached_networkx(graph: GraphModel) -> nx.DiGraph | None:
+    """The networkx view remembered for ``graph``, if its cycles were computed."""
+    return _NX_VIEWS.get(id(graph))
 
 
 def find_semantic_equivalences(
@@ -99,14 +124,15 @@ def find_semantic_equivalences(
     Returns list of (label_a, label_b, similarity_score) tuples.
     """
     labels = sorted(graph.states.keys())
+    # Normalize each label once, outside the pairwise comparison
+    norms = [_normalize_label(label) for label in labels]
     equivalences: list[tuple[str, str, float]] = []
 
     for i in range(len(labels)):
+        norm_a = norms[i]
         for j in range(i + 1, len(labels)):
             a, b = labels[i], labels[j]
-            # Normalize for comparison
-            norm_a = _normalize_label(a)
-            norm_b = _normalize_label(b)
+            norm_b = norms[j]
             if norm_a == norm_b:
                 equivalences.append((a, b, 1.0))
                 continue
@@ -126,39 +152,65 @@ def update_graph_incremental(
     existing: GraphModel, new_scenarios: list[Scenario], source_file: str
 ) -> GraphModel:
     """Update a graph by replacing scenarios from a single source file."""
-    # Remove transitions from the modified file
-    remaining_transitions = [
-        t for t in existing.transitions
-        if t.source_scenario not in {s.title for s in new_scenarios}
-    ]
+    replaced_titles = {s.title for s in new_scenarios}
+    new_graph = build_graph(ParseResult(scenarios=new_scenarios), detect_cycles=False)
 
-    # Build a temporary parse result for the new scenarios
-    temp = ParseResult(scenarios=new_scenarios)
-    new_graph = build_graph(temp)
+    # Split existing transitions into kept and removed in a single pass
+    kept: list[Transition] = []
+    removed: list[Transition] = []
+    for t in existing.transitions:
+        (removed if t.source_scenario in replaced_titles else kept).append(t)
 
     # Merge
     merged_states = dict(existing.states)
     for label, state in new_graph.states.items():
         merged_states[label] = state
 
-    all_transitions = remaining_transitions + new_graph.transitions
+    all_transitions = kept + new_graph.transitions
 
-    # Recalculate entry/terminal/cycles
+    # Recalculate entry/terminal
     then_labels = {t.to_state for t in all_transitions}
     given_labels = {t.from_state for t in all_transitions}
     entry_points = sorted(given_labels - then_labels)
     terminal_states = sorted(then_labels - given_labels)
 
-    nxg = _to_networkx_internal(merged_states, all_transitions)
-    cycles = [sorted(c) for c in nx.simple_cycles(nxg)]
-
-    return GraphModel(
+    # Apply the edge delta to a copy of the remembered networkx view; the
+    # existing graph and its view are left untouched
+    cached = _cached_networkx(existing)
+    full_scan = cached is None
+    if cached is None:
+        nxg = _to_networkx_internal(existing.states, existing.transitions)
+    else:
+        nxg = cached.copy()
+    live_edges = {(t.from_state, t.to_state) for t in all_transitions}
+    for t in removed:
+        if (t.from_state, t.to_state) not in live_edges and nxg.has_edge(t.from_state, t.to_state):
+            nxg.remove_edge(t.from_state, t.to_state)
+    nxg.add_nodes_from(new_graph.states)
+    introduces_cycle = False
+    for t in new_graph.transitions:
+        if not nxg.has_edge(t.from_state, t.to_state) and nx.has_path(
+            nxg, t.to_state, t.from_state
+        ):
+            introduces_cycle = True
+        nxg.add_edge(t.from_state, t.to_state, event=t.event)
+
+    # Removing edges cannot create cycles, so an acyclic graph stays acyclic
+    # unless one of the added edges closes a path back to its source.
+    if full_scan or existing.cycles or introduces_cycle:
+        cycles = _find_cycles(nxg)
+    else:
+        cycles = []
+
+    graph = GraphModel(
         states=merged_states,
         transitions=all_transitions,
         entry_points=entry_points,
         terminal_states=terminal_states,
         cycles=cycles,
     )
+    _remember_networkx(graph, nxg)
+    return graph
 
 
 def graph_to_json(graph: GraphModel) -> dict:
@@ -198,9 +250,29 @@ def _to_networkx_internal(
     return g
 
 
+def _find_cycles(g: nx.DiGraph) -> list[list[str]]:
+    """Enumerate simple cycles, confined to the graph's strongly connected components.
+
+    Acyclic graphs (the common case for specs) are rejected in linear time.
+    Each cycle is its sorted node labels, and the cycles are sorted, so the
+    result does not depend on component or enumeration order.
+    """
+    if nx.is_directed_acyclic_graph(g):
+        return []
+    cycles: list[list[str]] = []
+    for component in nx.strongly_connected_components(g):
+        if len(component) == 1:
+            node = next(iter(component))
+            if g.has_edge(node, node):
+                cycles.append([node])
+            continue
+        sub = g.subgraph(component)
+        cycles.extend(sorted(c) for c in nx.simple_cycles(sub))
+    cycles.sort()
+    return cycles
+
+
+@lru_cache(maxsize=4096)
 def _normalize_label(label: str) -> str:
     """Normalize a state label for comparison."""
-    words = label.lower().split()
-    # Remove articles and common filler words
-    stop = {"a", "an", "the", "is", "are", "has", "have", "there"}
-    return " ".join(w for w in words if w not in stop)
+    return " ".join(w for w in label.lower().split() if w not in _STOP)
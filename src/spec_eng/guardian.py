@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 
 from spec_eng.models import Clause, GuardianWarning, Scenario
 
-# Pattern categories with (regex, suggested replacement template)
+# Pattern categories with (regex, suggested replacement template).
+# Case-insensitive terms scope the flag inline with (?i:...).
 PATTERNS: dict[str, list[tuple[re.Pattern[str], str]]] = {
     "class_name": [
         # CamelCase identifiers (2+ uppercase transitions, min 2 parts)
@@ -20,31 +23,103 @@ PATTERNS: dict[str, list[tuple[re.Pattern[str], str]]] = {
         ),
     ],
     "database": [
-        (re.compile(r"\b(?:table|tables)\b", re.IGNORECASE), "collection/group"),
-        (re.compile(r"\b(?:row|rows)\b", re.IGNORECASE), "record/entry"),
-        (re.compile(r"\b(?:column|columns)\b", re.IGNORECASE), "field/attribute"),
-        (re.compile(r"\bschema\b", re.IGNORECASE), "structure"),
-        (re.compile(r"\bmigration\b", re.IGNORECASE), "update"),
+        (re.compile(r"(?i:\btables?\b)"), "collection/group"),
+        (re.compile(r"(?i:\brows?\b)"), "record/entry"),
+        (re.compile(r"(?i:\bcolumns?\b)"), "field/attribute"),
+        (re.compile(r"(?i:\bschema\b)"), "structure"),
+        (re.compile(r"(?i:\bmigration\b)"), "update"),
         (re.compile(r"\bSQL\b"), "query"),
-        (re.compile(r"\bdatabase\b", re.IGNORECASE), "data store"),
+        (re.compile(r"(?i:\bdatabase\b)"), "data store"),
     ],
     "api": [
         (re.compile(r"\b(?:POST|GET|PUT|DELETE|PATCH)\s+(?:request|to)\b"), "action"),
         (re.compile(r"/api/\S+"), "the system"),
-        (re.compile(r"\bendpoint\b", re.IGNORECASE), "capability"),
+        (re.compile(r"(?i:\bendpoint\b)"), "capability"),
         (re.compile(r"\bHTTP\b"), "request"),
-        (re.compile(r"\bstatus\s+code\b", re.IGNORECASE), "response"),
+        (re.compile(r"(?i:\bstatus\s+code\b)"), "response"),
     ],
     "framework": [
         (re.compile(r"\bRedis\b"), "cache"),
         (re.compile(r"\bKafka\b"), "message queue"),
         (re.compile(r"\bMongoDB\b"), "data store"),
-        (re.compile(r"\bcache\b", re.IGNORECASE), "stored data"),
-        (re.compile(r"\bqueue\b", re.IGNORECASE), "pending items"),
-        (re.compile(r"\bmiddleware\b", re.IGNORECASE), "processing step"),
+        (re.compile(r"(?i:\bcache\b)"), "stored data"),
+        (re.compile(r"(?i:\bqueue\b)"), "pending items"),
+        (re.compile(r"(?i:\bmiddleware\b)"), "processing step"),
     ],
 }
 
+
+# A pattern matching one whole word, optionally plural, optionally scoped (?i:...)
+_PLAIN_WORD_RE = re.compile(
+    r"\(\?i:\\b(?P<ci>\w+?)(?P<ci_plural>s\?)?\\b\)|\\b(?P<cs>\w+?)(?P<cs_plural>s\?)?\\b"
+)
+
+
+def _plain_word_spellings(pattern: re.Pattern[str]) -> tuple[tuple[str, ...], bool] | None:
+    """Words a plain-word pattern matches and whether it ignores case; None otherwise."""
+    m = _PLAIN_WORD_RE.fullmatch(pattern.pattern)
+    if m is None or pattern.flags & re.IGNORECASE:
+        return None
+    ignore_case = m.group("ci") is not None
+    word = m.group("ci") if ignore_case else m.group("cs")
+    plural = m.group("ci_plural" if ignore_case else "cs_plural")
+    return ((word, word + "s") if plural else (word,)), ignore_case
+
+
+# (case-sensitive, lowercase) word -> (pattern index, default suggestion) tables
+# of one category
+_LiteralTable = tuple[dict[str, tuple[int, str]], dict[str, tuple[int, str]]]
+
+
+def _build_literal_table(category: str) -> _LiteralTable | None:
+    """Word -> (pattern index, default) tables for a category of plain-word patterns.
+
+    Returns (case-sensitive table, lowercase table), or None if any pattern in the
+    category needs the regex engine.
+    """
+    exact: dict[str, tuple[int, str]] = {}
+    folded: dict[str, tuple[int, str]] = {}
+    for idx, (pattern, default_suggestion) in enumerate(PATTERNS[category]):
+        spellings = _plain_word_spellings(pattern)
+        if spellings is None:
+            return None
+        words, ignore_case = spellings
+        table = folded if ignore_case else exact
+        for word in words:
+            table.setdefault(word.lower() if ignore_case else word, (idx, default_suggestion))
+    return exact, folded
+
+
+# Categories that are plain word lists (database, framework) are matched by
+# looking up each word token in their tables, one pass over the clause, instead
+# of through the regex engine. Both views are derived from PATTERNS.
+_WORD_RE = re.compile(r"\w+")
+_LITERAL_TABLES: dict[str, _LiteralTable] = {
+    category: table
+    for category in PATTERNS
+    if (table := _build_literal_table(category)) is not None
+}
+
+# Lowercase substrings, one of which must occur in a clause before any of a
+# category's patterns can match. class_name has no literal trigger: every pattern in it
+# needs an uppercase letter, which is checked instead.
+_CATEGORY_TRIGGERS: dict[str, tuple[str, ...]] = {
+    "database": ("table", "row", "column", "schema", "migration", "sql", "database"),
+    "api": ("post", "get", "put", "delete", "patch", "/api/", "endpoint", "http", "status"),
+    "framework": ("redis", "kafka", "mongodb", "cache", "queue", "middleware"),
+}
+
+# Categories checked at each sensitivity; unknown values behave like medium
+_CATEGORIES: dict[str, tuple[str, ...]] = {
+    # Only high-confidence patterns: explicit class names and API routes
+    "low": ("class_name", "api"),
+    "medium": tuple(PATTERNS),
+    "high": tuple(PATTERNS),
+}
+
+# Class-name suffixes still flagged at low sensitivity
+_CLASS_SUFFIXES = ("Service", "Repository", "Controller", "Manager", "Factory", "Handler")
+
 # Suggestions for common implementation detail patterns
 SUGGESTIONS: dict[str, str] = {
     "UserService": "GIVEN no registered users",
@@ -55,6 +130,10 @@ SUGGESTIONS: dict[str, str] = {
     "Redis cache": "no cached sessions",
     "Redis": "cached",
 }
+# SUGGESTIONS keys lowercased once, in priority order
+_SUGGESTIONS_LOWER: tuple[tuple[str, str], ...] = tuple(
+    (impl_term.lower(), behavioral) for impl_term, behavioral in SUGGESTIONS.items()
+)
 
 
 def analyze_clause(
@@ -63,52 +142,107 @@ def analyze_clause(
     allowlist: list[str] | None = None,
 ) -> list[GuardianWarning]:
     """Analyze a single clause for implementation detail leakage."""
-    allowlist = allowlist or []
-    warnings: list[GuardianWarning] = []
-
+    allow_key = tuple(sorted(allowlist)) if allowlist else ()
     text = clause.text
+    # The memoized findings are immutable; each call gets its own warnings
+    return [
+        GuardianWarning(
+            original_text=text,
+            flagged_terms=[term],
+            suggested_alternative=suggestion,
+            category=category,
+        )
+        for term, suggestion, category in _analyze_text(
+            text, sensitivity, allow_key, clause.clause_type
+        )
+    ]
+
 
-    # Determine which categories to check based on sensitivity
-    if sensitivity == "low":
-        # Only high-confidence patterns: explicit class names and API routes
-        categories = ["class_name", "api"]
-    elif sensitivity == "high":
-        categories = list(PATTERNS.keys())
-    else:  # medium (default)
-        categories = list(PATTERNS.keys())
+@lru_cache(maxsize=4096)
+def _analyze_text(
+    text: str, sensitivity: str, allowlist: tuple[str, ...], clause_type: str
+) -> tuple[tuple[str, str, str], ...]:
+    """Flagged (term, suggestion, category) findings for one clause text."""
+    findings: list[tuple[str, str, str]] = []
+    allow_search = _compile_allowlist(allowlist).search if allowlist else None
 
+    categories = _CATEGORIES.get(sensitivity, _CATEGORIES["medium"])
+    lowered = text.lower()
+    words: list[str] | None = None
     for category in categories:
-        for pattern, default_suggestion in PATTERNS[category]:
-            matches = pattern.findall(text)
-            for match in matches:
-                # Check allowlist
-                if any(allowed.lower() in match.lower() for allowed in allowlist):
-                    continue
-
-                # For low sensitivity, skip single-word CamelCase
-                if sensitivity == "low" and category == "class_name":
-                    if not any(
-                        kw in match
-                        for kw in (
-                            "Service", "Repository", "Controller",
-                            "Manager", "Factory", "Handler",
-                        )
-                    ):
-                        continue
-
-                # Generate suggestion
-                suggestion = _suggest_alternative(
-                    text, match, clause.clause_type, default_suggestion
-                )
-
-                warnings.append(GuardianWarning(
-                    original_text=text,
-                    flagged_terms=[match],
-                    suggested_alternative=suggestion,
-                    category=category,
-                ))
+        # Cheap substring pre-screen before entering the regex engine
+        if category == "class_name":
+            if lowered == text:
+                continue
+        elif not any(trigger in lowered for trigger in _CATEGORY_TRIGGERS[category]):
+            continue
 
-    return warnings
+        found: Iterable[tuple[str, str]]
+        if category in _LITERAL_TABLES:
+            if words is None:
+                words = _WORD_RE.findall(text)
+            found = _scan_literal_terms(words, _LITERAL_TABLES[category])
+        else:
+            found = _scan_patterns(text, PATTERNS[category])
+
+        # For low sensitivity, skip single-word CamelCase
+        require_suffix = sensitivity == "low" and category == "class_name"
+        for match, default_suggestion in found:
+            # Check allowlist
+            if allow_search is not None and allow_search(match):
+                continue
+            if require_suffix and not any(kw in match for kw in _CLASS_SUFFIXES):
+                continue
+
+            # Generate suggestion
+            suggestion = _suggest_alternative(
+                text, match, clause_type, default_suggestion
+            )
+
+            findings.append((match, suggestion, category))
+
+    return tuple(findings)
+
+
+def _scan_patterns(
+    text: str, patterns: list[tuple[re.Pattern[str], str]]
+) -> list[tuple[str, str]]:
+    """Match each pattern in turn; returns [(term, default)] in pattern order.
+
+    Every pattern sees the whole text, so overlapping matches from different
+    patterns are all kept; a term matched at the same place twice is kept once.
+    """
+    seen: set[tuple[int, str]] = set()
+    hits: list[tuple[str, str]] = []
+    for pattern, default_suggestion in patterns:
+        for m in pattern.finditer(text):
+            key = (m.start(), m.group(0))
+            if key not in seen:
+                seen.add(key)
+                hits.append((m.group(0), default_suggestion))
+    return hits
+
+
+def _scan_literal_terms(words: list[str], table: _LiteralTable) -> list[tuple[str, str]]:
+    """Find a literal category's terms among word tokens; returns [(term, default)].
+
+    Hits are ordered as _scan_patterns orders them: by pattern, then by position.
+    """
+    exact, folded = table
+    hits: list[tuple[int, str, str]] = []
+    for word in words:
+        entry = exact.get(word) or folded.get(word.lower())
+        if entry is not None:
+            idx, default_suggestion = entry
+            hits.append((idx, word, default_suggestion))
+    hits.sort(key=lambda hit: hit[0])
+    return [(word, default_suggestion) for _, word, default_suggestion in hits]
+
+
+@lru_cache(maxsize=64)
+def _compile_allowlist(allowlist: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile allowlisted terms into one case-insensitive substring matcher."""
+    return re.compile("|".join(re.escape(term) for term in allowlist), re.IGNORECASE)
 
 
 def analyze_scenario(
@@ -116,11 +250,17 @@ def analyze_scenario(
     sensitivity: str = "medium",
     allowlist: list[str] | None = None,
 ) -> list[GuardianWarning]:
-    """Analyze all clauses in a scenario."""
-    warnings: list[GuardianWarning] = []
+    """Analyze all clauses in a scenario.
+
+    Identical warnings (same text, terms, suggestion and category) are
+    reported once per scenario.
+    """
+    unique: dict[tuple[str, tuple[str, ...], str, str], GuardianWarning] = {}
     for clause in scenario.givens + scenario.whens + scenario.thens:
-        warnings.extend(analyze_clause(clause, sensitivity, allowlist))
-    return warnings
+        for w in analyze_clause(clause, sensitivity, allowlist):
+            key = (w.original_text, tuple(w.flagged_terms), w.suggested_alternative, w.category)
+            unique.setdefault(key, w)
+    return list(unique.values())
 
 
 def analyze_file(
@@ -139,9 +279,15 @@ def _suggest_alternative(
     original: str, flagged: str, clause_type: str, default: str
 ) -> str:
     """Generate a behavioral alternative suggestion."""
-    # Check for known substitutions first
-    for impl_term, behavioral in SUGGESTIONS.items():
-        if impl_term.lower() in flagged.lower() or impl_term.lower() in original.lower():
-            return behavioral
+    # Flagged terms are always substrings of the original clause, so a known
+    # substitution is determined by the original text alone.
+    return _known_substitution(original) or default
 
-    return default
+
+@lru_cache(maxsize=4096)
+def _known_substitution(original: str) -> str | None:
+    lowered = original.lower()
+    for impl_term, behavioral in _SUGGESTIONS_LOWER:
+        if impl_term in lowered:
+            return behavioral
+    return None
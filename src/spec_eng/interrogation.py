@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from hashlib import sha256
+from hashlib import blake2b, file_digest
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +16,10 @@ VAGUE_TERMS = {
     "fast", "quick", "soon", "proper", "appropriate", "intuitive", "simple", "robust",
 }
 
+# Characters dropped from slugs, and the whitespace runs that become hyphens
+_SLUG_DROP = re.compile(r"[^a-z0-9\s-]")
+_SLUG_WS = re.compile(r"\s+")
+
 
 class InterrogationError(Exception):
     """Raised when interrogation workflow operations fail."""
@@ -47,9 +52,9 @@ class InterrogationSession:
             "idea": self.idea,
             "iteration": self.iteration,
             "approved": self.approved,
-            "answers": dict(sorted(self.answers.items())),
+            "answers": dict(self.answers),
             "ir_hash_history": list(self.ir_hash_history),
-            "last_outputs": dict(sorted(self.last_outputs.items())),
+            "last_outputs": dict(self.last_outputs),
         }
 
     @classmethod
@@ -67,8 +72,8 @@ class InterrogationSession:
 
 def default_slug(idea: str) -> str:
     slug = idea.lower().strip()
-    slug = re.sub(r"[^a-z0-9\s-]", "", slug)
-    slug = re.sub(r"[\s]+", "-", slug)
+    slug = _SLUG_DROP.sub("", slug)
+    slug = _SLUG_WS.sub("-", slug)
     return slug.strip("-") or "interrogation-spec"
 
 
@@ -86,11 +91,12 @@ def load_session(project_root: Path, slug: str) -> InterrogationSession | None:
 def save_session(project_root: Path, session: InterrogationSession) -> Path:
     path = session_path(project_root, session.slug)
     path.parent.mkdir(parents=True, exist_ok=True)
+    # Key order is fixed once here; to_dict() does not pre-sort.
     path.write_text(json.dumps(session.to_dict(), indent=2, sort_keys=True) + "\n")
     return path
 
 
-def parse_answer_flags(answer_flags: tuple[str, ...]) -> dict[str, str]:
+def parse_answer_flags(answer_flags: Iterable[str]) -> dict[str, str]:
     parsed: dict[str, str] = {}
     for answer in answer_flags:
         if "=" not in answer:
@@ -149,30 +155,26 @@ def detect_vague_terms(*texts: str) -> set[str]:
 def render_draft_gwt(session: InterrogationSession) -> str:
     """Render a deterministic draft GWT file from session state."""
     title = session.idea.strip().rstrip(".")
-    success = session.answers.get("success_criteria")
-    failure = session.answers.get("failure_case")
-    constraints = session.answers.get("constraints")
-
-    lines = [
-        ";===============================================================",
-        f"; Interrogation draft for: {title}.",
-        ";===============================================================",
-        f"GIVEN there is no acceptance spec describing {title}.",
-        "",
-        f"WHEN the user starts the ATDD workflow for \"{title}\".",
-        "",
-        f"THEN a DAL spec file exists at \"specs/{session.slug}.dal\".",
-        f"THEN a GWT spec file exists at \"specs/{session.slug}.txt\".",
-    ]
-
-    if success:
-        lines.append(f"THEN the regenerated GWT spec includes a scenario describing {success}.")
-    if failure:
-        lines.append(f"THEN the regenerated GWT spec includes a scenario describing {failure}.")
-    if constraints:
-        lines.append(f"THEN the regenerated GWT spec includes a scenario describing {constraints}.")
-
-    return "\n".join(lines) + "\n"
+    rule = ";==============================================================="
+    draft = (
+        f"{rule}\n"
+        f"; Interrogation draft for: {title}.\n"
+        f"{rule}\n"
+        f"GIVEN there is no acceptance spec describing {title}.\n"
+        "\n"
+        f"WHEN the user starts the ATDD workflow for \"{title}\".\n"
+        "\n"
+        f"THEN a DAL spec file exists at \"specs/{session.slug}.dal\".\n"
+        f"THEN a GWT spec file exists at \"specs/{session.slug}.txt\".\n"
+    )
+    answered = (
+        session.answers.get(key) for key in ("success_criteria", "failure_case", "constraints")
+    )
+    return draft + "".join(
+        f"THEN the regenerated GWT spec includes a scenario describing {answer}.\n"
+        for answer in answered
+        if answer
+    )
 
 
 def interrogate_iteration(
@@ -219,7 +221,9 @@ def interrogate_iteration(
         )
 
     ir_path = outputs["ir"]
-    ir_hash = sha256(ir_path.read_bytes()).hexdigest()
+    with ir_path.open("rb") as ir_file:
+        # Only compared with earlier iterations, so a fast non-SHA fingerprint suffices
+        ir_hash = file_digest(ir_file, lambda: blake2b(digest_size=32)).hexdigest()
     session.ir_hash_history.append(ir_hash)
     session.last_outputs = {k: str(v) for k, v in outputs.items()}
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -17,7 +20,7 @@ from spec_eng.graph import (
     graph_to_json,
 )
 from spec_eng.guardian import analyze_scenario
-from spec_eng.models import ParseResult, Scenario
+from spec_eng.models import Clause, GraphModel, ParseResult, Scenario
 from spec_eng.parser import parse_gwt_file, parse_gwt_string
 from spec_eng.pipeline import is_bootstrapped
 
@@ -27,16 +30,18 @@ mcp = FastMCP("spec-eng")
 # --- Serialization helpers ---
 
 
+def _serialize_clauses(clauses: list[Clause]) -> list[dict[str, Any]]:
+    """Serialize clauses to JSON-compatible dicts."""
+    return [{"type": c.clause_type, "text": c.text, "line": c.line_number} for c in clauses]
+
+
 def _serialize_scenario(scenario: Scenario) -> dict[str, Any]:
     """Serialize a Scenario to a JSON-compatible dict."""
     return {
         "title": scenario.title,
-        "givens": [{"type": c.clause_type, "text": c.text, "line": c.line_number}
-                   for c in scenario.givens],
-        "whens": [{"type": c.clause_type, "text": c.text, "line": c.line_number}
-                  for c in scenario.whens],
-        "thens": [{"type": c.clause_type, "text": c.text, "line": c.line_number}
-                  for c in scenario.thens],
+        "givens": _serialize_clauses(scenario.givens),
+        "whens": _serialize_clauses(scenario.whens),
+        "thens": _serialize_clauses(scenario.thens),
         "source_file": scenario.source_file,
         "line_number": scenario.line_number,
         "is_valid": scenario.is_valid,
@@ -55,30 +60,56 @@ def _serialize_parse_result(result: ParseResult) -> dict[str, Any]:
     }
 
 
+# --- Parse/graph reuse across tool calls ---
+
+# ("file", path, mtime_ns, size) or ("content", text)
+_SourceKey = tuple[str, str, int, int] | tuple[str, str]
+
+
+def _source_key(
+    content: str | None, file_path: str | None,
+) -> _SourceKey | None:
+    """Cache key for a tool's input: file identity plus mtime/size, or the content itself."""
+    if file_path:
+        stat = Path(file_path).stat()
+        return ("file", file_path, stat.st_mtime_ns, stat.st_size)
+    if content:
+        return ("content", content)
+    return None
+
+
+@lru_cache(maxsize=64)
+def _parse_by_key(key: _SourceKey) -> ParseResult:
+    if key[0] == "file":
+        return parse_gwt_file(Path(key[1]))
+    return parse_gwt_string(key[1])
+
+
+@lru_cache(maxsize=64)
+def _graph_by_key(key: _SourceKey) -> GraphModel:
+    return build_graph(_parse_by_key(key))
+
+
 # --- Tool implementation functions (testable without MCP) ---
 
 
 def _parse_gwt(
     content: str | None = None, file_path: str | None = None,
 ) -> dict[str, Any]:
-    if file_path:
-        result = parse_gwt_file(Path(file_path))
-    elif content:
-        result = parse_gwt_string(content)
-    else:
+    key = _source_key(content, file_path)
+    if key is None:
         return {"error": "Provide either 'content' or 'file_path'"}
+    result = _parse_by_key(key)
     return _serialize_parse_result(result)
 
 
 def _build_state_graph(
     content: str | None = None, file_path: str | None = None,
 ) -> dict[str, Any]:
-    if file_path:
-        result = parse_gwt_file(Path(file_path))
-    elif content:
-        result = parse_gwt_string(content)
-    else:
+    key = _source_key(content, file_path)
+    if key is None:
         return {"error": "Provide either 'content' or 'file_path'"}
+    result = _parse_by_key(key)
 
     if not result.is_success or not result.scenarios:
         return {
@@ -87,7 +118,7 @@ def _build_state_graph(
                              for e in result.errors],
         }
 
-    graph = build_graph(result)
+    graph = _graph_by_key(key)
     return graph_to_json(graph)
 
 
@@ -96,17 +127,15 @@ def _analyze_spec_gaps(
     file_path: str | None = None,
     project_root: str | None = None,
 ) -> dict[str, Any]:
-    if file_path:
-        result = parse_gwt_file(Path(file_path))
-    elif content:
-        result = parse_gwt_string(content)
-    else:
+    key = _source_key(content, file_path)
+    if key is None:
         return {"error": "Provide either 'content' or 'file_path'"}
+    result = _parse_by_key(key)
 
     if not result.is_success or not result.scenarios:
         return {"error": "Parse failed or no scenarios found"}
 
-    graph = build_graph(result)
+    graph = _graph_by_key(key)
     triaged: dict[str, str] = {}
     if project_root:
         triaged = load_triaged(Path(project_root))
@@ -134,12 +163,10 @@ def _check_guardian(
     sensitivity: str = "medium",
     allowlist: list[str] | None = None,
 ) -> dict[str, Any]:
-    if file_path:
-        result = parse_gwt_file(Path(file_path))
-    elif content:
-        result = parse_gwt_string(content)
-    else:
+    key = _source_key(content, file_path)
+    if key is None:
         return {"error": "Provide either 'content' or 'file_path'"}
+    result = _parse_by_key(key)
 
     if not result.scenarios:
         return {"warnings": [], "warning_count": 0, "clean": True}
@@ -167,17 +194,15 @@ def _find_equivalences(
     file_path: str | None = None,
     threshold: float = 0.7,
 ) -> dict[str, Any]:
-    if file_path:
-        result = parse_gwt_file(Path(file_path))
-    elif content:
-        result = parse_gwt_string(content)
-    else:
+    key = _source_key(content, file_path)
+    if key is None:
         return {"error": "Provide either 'content' or 'file_path'"}
+    result = _parse_by_key(key)
 
     if not result.scenarios:
         return {"equivalences": [], "count": 0}
 
-    graph = build_graph(result)
+    graph = _graph_by_key(key)
     equivs = find_semantic_equivalences(graph, threshold)
     return {
         "equivalences": [
@@ -193,17 +218,15 @@ def _export_graph(
     file_path: str | None = None,
     format: str = "json",
 ) -> dict[str, Any]:
-    if file_path:
-        result = parse_gwt_file(Path(file_path))
-    elif content:
-        result = parse_gwt_string(content)
-    else:
+    key = _source_key(content, file_path)
+    if key is None:
         return {"error": "Provide either 'content' or 'file_path'"}
+    result = _parse_by_key(key)
 
     if not result.scenarios:
         return {"error": "No scenarios to export"}
 
-    graph = build_graph(result)
+    graph = _graph_by_key(key)
 
     if format == "dot":
         return {"format": "dot", "output": export_dot(graph)}
@@ -235,31 +258,19 @@ def _get_project_status(project_root: str = ".") -> dict[str, Any]:
         gwt_files = list(specs_dir.glob("*.gwt"))
         status["spec_files"] = len(gwt_files)
 
-        all_scenarios: list[Scenario] = []
-        all_errors = []
-        for f in gwt_files:
-            r = parse_gwt_file(f)
-            all_scenarios.extend(r.scenarios)
-            all_errors.extend(r.errors)
-
-        status["scenario_count"] = len(all_scenarios)
-        status["parse_errors"] = len(all_errors)
-
-        if all_scenarios:
-            combined = ParseResult(scenarios=all_scenarios, errors=all_errors)
-            graph = build_graph(combined)
-            status["states"] = len(graph.states)
-            status["transitions"] = len(graph.transitions)
-            status["entry_points"] = len(graph.entry_points)
-            status["terminal_states"] = len(graph.terminal_states)
-            status["cycles"] = len(graph.cycles)
-
-            triaged = load_triaged(root)
-            gaps = analyze_gaps(graph, triaged)
-            status["gaps"] = len(gaps)
-            status["high_severity_gaps"] = sum(
-                1 for g in gaps if g.severity.value == "high"
-            )
+        # Reuse the previous analysis while no spec or gap-report file has changed
+        tracked = [*gwt_files, root / ".spec-eng" / "gaps.json"]
+        fingerprint = frozenset(
+            (str(f), st.st_mtime_ns, st.st_size)
+            for f in tracked
+            if (st := _stat_or_none(f)) is not None
+        )
+        cache_key = str(root.resolve())
+        cached = _STATUS_CACHE.get(cache_key)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, _analyze_project_specs(root, gwt_files))
+            _STATUS_CACHE[cache_key] = cached
+        status.update(cached[1])
     else:
         status["spec_files"] = 0
         status["scenario_count"] = 0
@@ -267,6 +278,53 @@ def _get_project_status(project_root: str = ".") -> dict[str, Any]:
     return status
 
 
+# Project root -> (spec/gap file fingerprint, spec analysis part of the status)
+_STATUS_CACHE: dict[str, tuple[frozenset[tuple[str, int, int]], dict[str, Any]]] = {}
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _analyze_project_specs(root: Path, gwt_files: list[Path]) -> dict[str, Any]:
+    """Parse, graph and gap-analyze a project's spec files for the status report."""
+    analysis: dict[str, Any] = {}
+    results: list[ParseResult] = []
+    if gwt_files:
+        # Overlap file reads across spec files; results keep glob order
+        with ThreadPoolExecutor(max_workers=min(8, len(gwt_files))) as pool:
+            results = list(pool.map(parse_gwt_file, gwt_files))
+
+    all_scenarios: list[Scenario] = []
+    all_errors = []
+    for r in results:
+        all_scenarios.extend(r.scenarios)
+        all_errors.extend(r.errors)
+
+    analysis["scenario_count"] = len(all_scenarios)
+    analysis["parse_errors"] = len(all_errors)
+
+    if all_scenarios:
+        combined = ParseResult(scenarios=all_scenarios, errors=all_errors)
+        graph = build_graph(combined)
+        analysis["states"] = len(graph.states)
+        analysis["transitions"] = len(graph.transitions)
+        analysis["entry_points"] = len(graph.entry_points)
+        analysis["terminal_states"] = len(graph.terminal_states)
+        analysis["cycles"] = len(graph.cycles)
+
+        triaged = load_triaged(root)
+        gaps = analyze_gaps(graph, triaged)
+        analysis["gaps"] = len(gaps)
+        analysis["high_severity_gaps"] = sum(
+            1 for g in gaps if g.severity.value == "high"
+        )
+    return analysis
+
+
 # --- MCP tool registration (thin wrappers) ---
 
 
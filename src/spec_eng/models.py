@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Clause:
     """A single GIVEN, WHEN, or THEN clause."""
 
@@ -19,7 +19,7 @@ class Clause:
             raise ValueError(f"Invalid clause type: {self.clause_type}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     """A complete GWT scenario with title and clauses."""
 
@@ -45,10 +45,11 @@ class Scenario:
 
     @property
     def is_valid(self) -> bool:
-        return len(self.validate()) == 0
+        # Short-circuit instead of building validate()'s error messages
+        return bool(self.title and self.givens and self.whens and self.thens)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseError:
     """An error encountered during parsing."""
 
@@ -69,7 +70,7 @@ class ParseResult:
         return len(self.errors) == 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class State:
     """A state in the behavioral state machine."""
 
@@ -77,7 +78,7 @@ class State:
     source_scenarios: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class Transition:
     """A transition (edge) in the state machine."""
 
@@ -105,7 +106,7 @@ class Severity(Enum):
     LOW = "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class Gap:
     """A gap identified in the state machine."""
 
@@ -129,7 +130,7 @@ class GraphModel:
     cycles: list[list[str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GuardianWarning:
     """A warning from the spec guardian about implementation detail leakage."""
 
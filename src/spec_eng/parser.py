@@ -15,6 +15,9 @@ Grammar (informal EBNF):
 
 from __future__ import annotations
 
+import io
+import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
@@ -32,95 +35,97 @@ class TokenType(Enum):
     EOF = auto()
 
 
-@dataclass
+# Clause keyword followed by a space, in any case; matched against stripped lines
+_CLAUSE_RE = re.compile(r"(GIVEN|WHEN|THEN) ", re.IGNORECASE)
+_CLAUSE_TOKENS = {"GIVEN": TokenType.GIVEN, "WHEN": TokenType.WHEN, "THEN": TokenType.THEN}
+
+
+@dataclass(slots=True)
 class Token:
     type: TokenType
     text: str
     line_number: int
 
 
+def _iter_lines(content: str) -> Iterator[str]:
+    """Yield the stripped lines of ``content.split("\\n")`` without building the list."""
+    line = ""
+    for line in io.StringIO(content):
+        yield line.strip()
+    if not line or line.endswith("\n"):
+        yield ""
+
+
 class Lexer:
     """Tokenizes raw GWT text into a token stream."""
 
     def __init__(self, content: str, source_file: str | None = None) -> None:
-        self.lines = content.split("\n")
+        self.content = content
         self.source_file = source_file
+        self._lines: list[str] | None = None
+
+    @classmethod
+    def from_lines(cls, lines: list[str], source_file: str | None = None) -> Lexer:
+        """Create a lexer over lines that are already split and stripped."""
+        lexer = cls("", source_file)
+        lexer._lines = lines
+        return lexer
 
     def tokenize(self) -> list[Token]:
         tokens: list[Token] = []
-        i = 0
-        while i < len(self.lines):
-            line = self.lines[i]
-            stripped = line.strip()
-            line_num = i + 1  # 1-indexed
-
+        source = self._lines if self._lines is not None else _iter_lines(self.content)
+        lines = enumerate(source, 1)  # 1-indexed
+        for line_num, stripped in lines:
             if not stripped:
                 tokens.append(Token(TokenType.BLANK, "", line_num))
-                i += 1
                 continue
 
             if stripped.startswith(";") and "===" in stripped:
                 tokens.append(Token(TokenType.HEADER_BAR, stripped, line_num))
-                i += 1
                 continue
 
             if stripped.startswith(";"):
                 # Comment line - extract text after ;
                 comment_text = stripped[1:].strip()
                 tokens.append(Token(TokenType.COMMENT, comment_text, line_num))
-                i += 1
                 continue
 
             # Clause lines: may span multiple lines until terminated by '.'
-            clause_type = self._detect_clause_type(stripped)
-            if clause_type is not None:
-                full_text, end_i = self._read_clause(i)
-                tokens.append(Token(clause_type, full_text, line_num))
-                i = end_i + 1
-                continue
+            match = _CLAUSE_RE.match(stripped)
+            if match is not None:
+                full_text = self._read_clause(stripped[match.end():], lines)
+                tokens.append(Token(_CLAUSE_TOKENS[match[1].upper()], full_text, line_num))
 
             # Unknown line - skip (will be handled by parser as needed)
-            i += 1
 
-        tokens.append(Token(TokenType.EOF, "", len(self.lines) + 1))
+        line_count = (
+            len(self._lines) if self._lines is not None else self.content.count("\n") + 1
+        )
+        tokens.append(Token(TokenType.EOF, "", line_count + 1))
         return tokens
 
-    def _detect_clause_type(self, line: str) -> TokenType | None:
-        upper = line.upper()
-        if upper.startswith("GIVEN "):
-            return TokenType.GIVEN
-        if upper.startswith("WHEN "):
-            return TokenType.WHEN
-        if upper.startswith("THEN "):
-            return TokenType.THEN
-        return None
-
-    def _read_clause(self, start: int) -> tuple[str, int]:
-        """Read a clause that may span multiple lines. Returns (text, last_line_index)."""
-        parts: list[str] = []
-        i = start
-        while i < len(self.lines):
-            line = self.lines[i].strip()
-            if i == start:
-                # Remove the keyword prefix
-                for prefix in ("GIVEN ", "WHEN ", "THEN "):
-                    upper = line.upper()
-                    if upper.startswith(prefix):
-                        line = line[len(prefix):]
-                        break
-                    # Handle case-sensitive match
-                    if line.startswith(prefix):
-                        line = line[len(prefix):]
-                        break
-            parts.append(line)
-            if line.endswith("."):
+    def _read_clause(self, first: str, lines: Iterator[tuple[int, str]]) -> str:
+        """Read a clause that may span multiple lines.
+
+        ``first`` is the opening line without its keyword prefix; continuation
+        lines are consumed from ``lines`` until one ends with a period.
+        """
+        if first.endswith("."):
+            # Common single-line clause: no list or join needed
+            return first[:-1].strip()
+        parts = [first]
+        line = first
+        while not line.endswith("."):
+            nxt = next(lines, None)
+            if nxt is None:
                 break
-            i += 1
+            line = nxt[1]
+            parts.append(line)
         text = " ".join(parts)
-        # Remove trailing period
-        if text.endswith("."):
+        # Remove trailing period (the joined text ends with the last line read)
+        if line.endswith("."):
             text = text[:-1].strip()
-        return text, i
+        return text
 
 
 class Parser:
@@ -130,6 +135,8 @@ class Parser:
         self, tokens: list[Token], source_file: str | None = None
     ) -> None:
         self.tokens = tokens
+        # Token types as a parallel list, so type checks skip the Token objects
+        self._types = [t.type for t in tokens]
         self.source_file = source_file
         self.pos = 0
         self.scenarios: list[Scenario] = []
@@ -140,9 +147,9 @@ class Parser:
         self._skip_blanks()
 
         while not self._at_end():
-            if self._peek().type == TokenType.HEADER_BAR:
+            if self._peek_type() is TokenType.HEADER_BAR:
                 self._parse_scenario()
-            elif self._peek().type in (TokenType.GIVEN, TokenType.WHEN, TokenType.THEN):
+            elif self._peek_type() in (TokenType.GIVEN, TokenType.WHEN, TokenType.THEN):
                 # Scenario without header
                 line = self._peek().line_number
                 self._parse_scenario_body(title="Untitled scenario", start_line=line)
@@ -164,7 +171,7 @@ class Parser:
 
     def _parse_header(self) -> tuple[str | None, int]:
         """Parse header bars and comment lines. Returns (title, line_number)."""
-        if self._peek().type != TokenType.HEADER_BAR:
+        if self._peek_type() is not TokenType.HEADER_BAR:
             return None, 0
 
         start_line = self._peek().line_number
@@ -172,12 +179,12 @@ class Parser:
 
         # Collect comment lines for the title
         title_parts: list[str] = []
-        while not self._at_end() and self._peek().type == TokenType.COMMENT:
+        while self._peek_type() is TokenType.COMMENT:
             title_parts.append(self._peek().text)
             self._advance()
 
         # Consume closing bar if present
-        if not self._at_end() and self._peek().type == TokenType.HEADER_BAR:
+        if self._peek_type() is TokenType.HEADER_BAR:
             self._advance()
 
         title = " ".join(title_parts).strip()
@@ -202,28 +209,35 @@ class Parser:
             line_number=start_line,
         )
 
-        validation_errors = scenario.validate()
-        if validation_errors:
-            for err in validation_errors:
-                self.errors.append(ParseError(
-                    message=f"{err} (scenario: '{title}')",
-                    line_number=start_line,
-                    source_file=self.source_file,
-                ))
-        else:
+        # is_valid short-circuits; error messages are only built for invalid scenarios
+        if scenario.is_valid:
             self.scenarios.append(scenario)
+            return
+        for err in scenario.validate():
+            self.errors.append(ParseError(
+                message=f"{err} (scenario: '{title}')",
+                line_number=start_line,
+                source_file=self.source_file,
+            ))
 
     def _parse_clauses(self, token_type: TokenType, clause_type: str) -> list[Clause]:
         """Parse one or more consecutive clauses of the given type."""
         clauses: list[Clause] = []
-        while not self._at_end() and self._peek().type == token_type:
-            token = self._advance()
+        # Walk the stream with local indices; self.pos is written back once
+        tokens, types = self.tokens, self._types
+        pos, n = self.pos, len(types)
+        blank = TokenType.BLANK
+        while pos < n and types[pos] is token_type:
+            token = tokens[pos]
             clauses.append(Clause(
                 clause_type=clause_type,
                 text=token.text,
                 line_number=token.line_number,
             ))
-            self._skip_blanks()
+            pos += 1
+            while pos < n and types[pos] is blank:
+                pos += 1
+        self.pos = pos
         return clauses
 
     def _peek(self) -> Token:
@@ -236,12 +250,20 @@ class Parser:
         self.pos += 1
         return token
 
+    def _peek_type(self) -> TokenType:
+        if self.pos < len(self._types):
+            return self._types[self.pos]
+        return TokenType.EOF
+
     def _at_end(self) -> bool:
-        return self._peek().type == TokenType.EOF
+        return self._peek_type() is TokenType.EOF
 
     def _skip_blanks(self) -> None:
-        while not self._at_end() and self._peek().type == TokenType.BLANK:
-            self._advance()
+        types = self._types
+        pos = self.pos
+        while pos < len(types) and types[pos] is TokenType.BLANK:
+            pos += 1
+        self.pos = pos
 
 
 def parse_gwt_string(content: str, source_file: str | None = None) -> ParseResult:
@@ -252,9 +274,18 @@ def parse_gwt_string(content: str, source_file: str | None = None) -> ParseResul
     return parser.parse()
 
 
+def _read_spec_text(path: Path) -> str:
+    """Read a spec file as UTF-8 with a single decode, bypassing the text-mode layer."""
+    content = path.read_bytes().decode("utf-8")
+    if "\r" in content:
+        # Normalize line endings as universal-newline reading would
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
 def parse_gwt_file(path: Path) -> ParseResult:
     """Parse a GWT file into a ParseResult."""
-    content = path.read_text()
+    content = _read_spec_text(path)
     return parse_gwt_string(content, source_file=str(path))
 
 
@@ -264,70 +295,58 @@ def parse_markdown_gwt(path: Path) -> ParseResult:
     Looks for lines starting with GIVEN/WHEN/THEN preceded by ;=== headers.
     Also handles indented GWT blocks (e.g., inside SPEC.md scenario descriptions).
     """
-    content = path.read_text()
-    lines = content.split("\n")
+    content = _read_spec_text(path)
 
     # Extract GWT blocks: find sections delimited by ;=== headers
-    gwt_blocks: list[str] = []
+    gwt_blocks: list[list[str]] = []
     current_block: list[str] = []
     in_block = False
+    has_clause = False  # whether current_block holds a GIVEN/WHEN/THEN line
 
-    for line in lines:
-        stripped = line.strip()
-
-        # Start of a GWT scenario header
-        if stripped.startswith(";") and "===" in stripped:
-            if not in_block:
+    # Each line is classified once: ';' lines, then blanks, clauses or other text
+    for stripped in _iter_lines(content):
+        if stripped.startswith(";"):
+            if in_block:
+                # Header bars and title comments inside a block
+                current_block.append(stripped)
+            elif "===" in stripped:
+                # Start of a GWT scenario header
                 in_block = True
+                has_clause = False
                 current_block = [stripped]
-            else:
-                current_block.append(stripped)
             continue
 
-        if in_block:
-            if stripped.startswith(";"):
-                current_block.append(stripped)
-                continue
+        if not in_block:
+            continue
 
+        if not stripped:
+            current_block.append("")
+        elif _CLAUSE_RE.match(stripped):
             # GWT clause lines (possibly indented in markdown)
-            upper = stripped.upper()
-            if (
-                upper.startswith("GIVEN ")
-                or upper.startswith("WHEN ")
-                or upper.startswith("THEN ")
-            ):
-                current_block.append(stripped)
-                continue
-
-            if stripped == "":
-                current_block.append("")
-                continue
-
-            # Non-GWT content: check if we had actual clauses
-            if any(
-                ln.strip().upper().startswith(("GIVEN ", "WHEN ", "THEN "))
-                for ln in current_block
-            ):
-                gwt_blocks.append("\n".join(current_block))
+            current_block.append(stripped)
+            has_clause = True
+        else:
+            # Non-GWT content closes the block; keep it only if it had clauses
+            if has_clause:
+                gwt_blocks.append(current_block)
             current_block = []
             in_block = False
 
     # Handle last block
-    if in_block and any(
-        ln.strip().upper().startswith(("GIVEN ", "WHEN ", "THEN "))
-        for ln in current_block
-    ):
-        gwt_blocks.append("\n".join(current_block))
+    if in_block and has_clause:
+        gwt_blocks.append(current_block)
 
     # Parse each block
     all_scenarios: list[Scenario] = []
     all_errors: list[ParseError] = []
 
+    # Blocks hold stripped lines already, so lex them directly instead of
+    # joining each block back into text for parse_gwt_string to split again
+    source_file = str(path)
     for block in gwt_blocks:
-        result = parse_gwt_string(block, source_file=str(path))
-        for s in result.scenarios:
-            all_scenarios.append(s)
-        for e in result.errors:
-            all_errors.append(e)
+        tokens = Lexer.from_lines(block, source_file).tokenize()
+        result = Parser(tokens, source_file).parse()
+        all_scenarios.extend(result.scenarios)
+        all_errors.extend(result.errors)
 
     return ParseResult(scenarios=all_scenarios, errors=all_errors)
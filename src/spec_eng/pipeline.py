@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
-from spec_eng.config import ensure_initialized
+from spec_eng.config import SPEC_ENG_DIR, ensure_initialized
 from spec_eng.models import ProjectConfig
 
 REFERENCE_SPEC = """\
@@ -28,7 +29,7 @@ def bootstrap_pipeline(project_root: Path, refresh: bool = False) -> dict[str, s
     """
     config = ensure_initialized(project_root)
 
-    pipeline_dir = project_root / ".spec-eng" / "pipeline"
+    pipeline_dir = _pipeline_dir(project_root)
     pipeline_dir.mkdir(parents=True, exist_ok=True)
 
     # Save pipeline config
@@ -39,7 +40,7 @@ def bootstrap_pipeline(project_root: Path, refresh: bool = False) -> dict[str, s
         "parser": "gwt",
         "generator": f"{config.framework or 'pytest'}_generator",
     }
-    (pipeline_dir / "config.json").write_text(
+    _pipeline_config_path(project_root).write_text(
         json.dumps(pipeline_config, indent=2)
     )
 
@@ -56,11 +57,25 @@ def bootstrap_pipeline(project_root: Path, refresh: bool = False) -> dict[str, s
 
 def is_bootstrapped(project_root: Path) -> bool:
     """Check if the pipeline is bootstrapped."""
-    return (project_root / ".spec-eng" / "pipeline" / "config.json").exists()
+    return _pipeline_config_path(project_root).exists()
+
+
+def _pipeline_dir(project_root: Path) -> Path:
+    return project_root / SPEC_ENG_DIR / "pipeline"
+
+
+def _pipeline_config_path(project_root: Path) -> Path:
+    return _pipeline_dir(project_root) / "config.json"
 
 
 def _validate_pipeline(project_root: Path, config: ProjectConfig) -> bool:
     """Validate the pipeline against a reference spec."""
+    return _reference_pipeline_valid()
+
+
+@lru_cache(maxsize=1)
+def _reference_pipeline_valid() -> bool:
+    """Parse the reference spec and compile its generated test; inputs are constant."""
     from spec_eng.parser import parse_gwt_string
 
     result = parse_gwt_string(REFERENCE_SPEC, source_file="<reference>")
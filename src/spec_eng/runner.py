@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import re
 import subprocess
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from spec_eng.config import SPEC_ENG_DIR
 
-@dataclass
+# Counts in a pytest summary line ("5 passed, 2 failed, 1 skipped, 1 error")
+_SUMMARY_RE = re.compile(r"(\d+) (passed|failed|skipped|error)")
+_SUMMARY_FIELDS = {"passed": "passed", "failed": "failed", "skipped": "skipped", "error": "errors"}
+
+
+@dataclass(slots=True)
 class TestResult:
     """Result of running a test suite."""
 
@@ -33,9 +40,9 @@ def run_acceptance_tests(project_root: Path) -> TestResult:
 
     Regenerates tests if specs have changed since last generation.
     """
-    generated_dir = project_root / ".spec-eng" / "generated"
+    generated_dir = _generated_dir(project_root)
 
-    if not generated_dir.exists() or not list(generated_dir.glob("test_*.py")):
+    if not generated_dir.exists() or next(generated_dir.glob("test_*.py"), None) is None:
         return TestResult(output="No generated tests found. Run `spec-eng generate` first.")
 
     # Check if specs are newer than generated tests
@@ -46,6 +53,10 @@ def run_acceptance_tests(project_root: Path) -> TestResult:
     return _run_pytest(generated_dir)
 
 
+def _generated_dir(project_root: Path) -> Path:
+    return project_root / SPEC_ENG_DIR / "generated"
+
+
 def run_unit_tests(project_root: Path) -> TestResult:
     """Run the project's unit tests."""
     # Look for common test directories
@@ -69,7 +80,9 @@ def run_unit_tests(project_root: Path) -> TestResult:
 def run_verify(project_root: Path) -> TestResult:
     """Run both acceptance and unit tests.
 
-    Both must pass for verification to succeed.
+    Both must pass for verification to succeed. The suites run one after the
+    other, so projects whose tests share a database, port or fixture files
+    cannot interfere with themselves.
     """
     acceptance = run_acceptance_tests(project_root)
     unit = run_unit_tests(project_root)
@@ -115,26 +128,16 @@ def _parse_pytest_output(output: str, returncode: int) -> TestResult:
     """Parse pytest output to extract results."""
     result = TestResult(output=output)
 
-    for line in output.split("\n"):
+    for line in output.splitlines():
         line = line.strip()
 
         # Parse summary line like "5 passed, 2 failed, 1 skipped"
         if "passed" in line or "failed" in line or "error" in line:
-            import re
-
-            passed = re.search(r"(\d+) passed", line)
-            failed = re.search(r"(\d+) failed", line)
-            skipped = re.search(r"(\d+) skipped", line)
-            errors = re.search(r"(\d+) error", line)
-
-            if passed:
-                result.passed = int(passed.group(1))
-            if failed:
-                result.failed = int(failed.group(1))
-            if skipped:
-                result.skipped = int(skipped.group(1))
-            if errors:
-                result.errors = int(errors.group(1))
+            counts: dict[str, int] = {}
+            for match in _SUMMARY_RE.finditer(line):
+                counts.setdefault(match.group(2), int(match.group(1)))
+            for kind, count in counts.items():
+                setattr(result, _SUMMARY_FIELDS[kind], count)
 
         # Track failing test names
         if line.startswith("FAILED"):
@@ -146,25 +149,27 @@ def _parse_pytest_output(output: str, returncode: int) -> TestResult:
 def _regenerate_if_stale(
     project_root: Path, specs_dir: Path, generated_dir: Path
 ) -> None:
-    """Regenerate tests if any spec file is newer than its generated test."""
+    """Regenerate tests for spec files that are newer than their generated test.
+
+    Each spec file produces its own test file, so only stale specs are re-parsed.
+    """
     from spec_eng.generator import generate_tests
     from spec_eng.models import ParseResult
     from spec_eng.parser import parse_gwt_file
 
-    needs_regen = False
-    for gwt_file in specs_dir.glob("*.gwt"):
+    stale: list[Path] = []
+    for gwt_file in sorted(specs_dir.glob("*.gwt")):
         test_file = generated_dir / f"test_{gwt_file.stem}.py"
-        if not test_file.exists():
-            needs_regen = True
-            break
-        if gwt_file.stat().st_mtime > test_file.stat().st_mtime:
-            needs_regen = True
-            break
-
-    if needs_regen:
-        all_scenarios = []
-        for gwt_file in sorted(specs_dir.glob("*.gwt")):
-            r = parse_gwt_file(gwt_file)
-            all_scenarios.extend(r.scenarios)
-        if all_scenarios:
-            generate_tests(project_root, ParseResult(scenarios=all_scenarios))
+        try:
+            test_mtime = test_file.stat().st_mtime
+        except FileNotFoundError:
+            stale.append(gwt_file)
+            continue
+        if gwt_file.stat().st_mtime > test_mtime:
+            stale.append(gwt_file)
+
+    all_scenarios = []
+    for gwt_file in stale:
+        all_scenarios.extend(parse_gwt_file(gwt_file).scenarios)
+    if all_scenarios:
+        generate_tests(project_root, ParseResult(scenarios=all_scenarios))
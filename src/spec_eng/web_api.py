@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import json
+from collections.abc import Callable
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
@@ -12,10 +13,50 @@ from typing import Any
 from spec_eng.workflow_mcp import _interrogate, _spec_check, _spec_compile
 
 
+def _post_compile(payload: dict[str, Any], root: str) -> dict[str, Any]:
+    return _spec_compile(
+        input_path=str(payload["input_path"]),
+        project_root=str(payload.get("project_root", root)),
+    )
+
+
+def _post_check(payload: dict[str, Any], root: str) -> dict[str, Any]:
+    return _spec_check(
+        input_path=str(payload["input_path"]),
+        project_root=str(payload.get("project_root", root)),
+    )
+
+
+def _post_interrogate(payload: dict[str, Any], root: str) -> dict[str, Any]:
+    return _interrogate(
+        idea=str(payload["idea"]),
+        project_root=str(payload.get("project_root", root)),
+        slug=payload.get("slug"),
+        answers=payload.get("answers", ()),
+        approve=bool(payload.get("approve", False)),
+    )
+
+
+# POST path -> (handler taking (payload, default project root), required payload keys)
+_ROUTES: dict[str, tuple[Callable[[dict[str, Any], str], dict[str, Any]], tuple[str, ...]]] = {
+    "/compile": (_post_compile, ("input_path",)),
+    "/check": (_post_check, ("input_path",)),
+    "/interrogate": (_post_interrogate, ("idea",)),
+}
+
+
 class WorkflowHandler(BaseHTTPRequestHandler):
     """JSON HTTP interface for compile/check/interrogate operations."""
 
     project_root = Path(".")
+    # Buffer wfile so the header block and JSON body leave in one send; the
+    # buffer is flushed when the handler finishes each request.
+    wbufsize = 64 * 1024
+    # Keep connections open between requests; every response carries a
+    # Content-Length, so clients can reuse the socket. Idle sockets are dropped
+    # after ``timeout`` seconds so they do not pin server threads.
+    protocol_version = "HTTP/1.1"
+    timeout = 30
 
     def do_GET(self) -> None:  # noqa: N802
         if self.path == "/health":
@@ -24,47 +65,51 @@ class WorkflowHandler(BaseHTTPRequestHandler):
         self._write_json({"ok": False, "error": "Not found"}, HTTPStatus.NOT_FOUND)
 
     def do_POST(self) -> None:  # noqa: N802
-        if self.path not in {"/compile", "/check", "/interrogate"}:
+        route = _ROUTES.get(self.path)
+        if route is None:
+            self._discard_body()
             self._write_json({"ok": False, "error": "Not found"}, HTTPStatus.NOT_FOUND)
             return
 
+        handler, required = route
         try:
             payload = self._read_json_body()
-            response = self._dispatch(self.path, payload)
+            missing = [key for key in required if key not in payload]
+            if missing:
+                raise ValueError(f"Missing required field(s): {', '.join(missing)}")
+            response = handler(payload, str(self.project_root))
             self._write_json(response, HTTPStatus.OK)
         except Exception as exc:  # broad by design for API boundary
             self._write_json({"ok": False, "error": str(exc)}, HTTPStatus.BAD_REQUEST)
 
-    def _dispatch(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
-        root = str(self.project_root)
-        if path == "/compile":
-            return _spec_compile(
-                input_path=str(payload["input_path"]),
-                project_root=str(payload.get("project_root", root)),
-            )
-        if path == "/check":
-            return _spec_check(
-                input_path=str(payload["input_path"]),
-                project_root=str(payload.get("project_root", root)),
-            )
-        return _interrogate(
-            idea=str(payload["idea"]),
-            project_root=str(payload.get("project_root", root)),
-            slug=payload.get("slug"),
-            answers=list(payload.get("answers", [])),
-            approve=bool(payload.get("approve", False)),
-        )
+    def _content_length(self) -> int:
+        try:
+            return int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            # The body boundary is unknown, so the connection cannot be reused
+            self.close_connection = True
+            raise ValueError("Invalid Content-Length header") from None
+
+    def _discard_body(self) -> None:
+        """Consume an unread request body so the next request starts cleanly."""
+        try:
+            length = self._content_length()
+        except ValueError:
+            return
+        if length:
+            self.rfile.read(length)
 
     def _read_json_body(self) -> dict[str, Any]:
-        length = int(self.headers.get("Content-Length", "0"))
+        length = self._content_length()
         raw = self.rfile.read(length) if length else b"{}"
-        data = json.loads(raw.decode("utf-8"))
+        data = json.loads(raw)  # accepts UTF-8 bytes directly
         if not isinstance(data, dict):
             raise ValueError("JSON body must be an object")
         return data
 
     def _write_json(self, payload: dict[str, Any], status: HTTPStatus) -> None:
-        body = (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+        # Compact output stays on the C encoder; indent forces the pure-Python one
+        body = (json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
@@ -2,22 +2,32 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from fastmcp import FastMCP
 
-from spec_eng.dual_spec import check_specs, compile_spec, load_vocab
+from spec_eng.dual_spec import Vocab, check_specs, compile_spec, load_vocab
 from spec_eng.interrogation import interrogate_iteration, parse_answer_flags
 
 mcp = FastMCP("spec-eng-workflow")
 
 
-def _load_vocab_for_root(project_root: Path):
+def _load_vocab_for_root(project_root: Path) -> Vocab:
     vocab_path = project_root / "specs" / "vocab.yaml"
-    if not vocab_path.exists():
-        raise FileNotFoundError(f"Missing vocabulary file: {vocab_path}")
-    return load_vocab(vocab_path)
+    try:
+        stat = vocab_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing vocabulary file: {vocab_path}") from None
+    return _load_vocab_cached(str(vocab_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _load_vocab_cached(vocab_path: str, mtime_ns: int, size: int) -> Vocab:
+    """Parse a vocab file once per (path, mtime, size); edits change the key."""
+    return load_vocab(Path(vocab_path))
 
 
 def _spec_compile(input_path: str, project_root: str = ".") -> dict[str, Any]:
@@ -64,11 +74,11 @@ def _interrogate(
     idea: str,
     project_root: str = ".",
     slug: str | None = None,
-    answers: list[str] | None = None,
+    answers: Sequence[str] | None = None,
     approve: bool = False,
 ) -> dict[str, Any]:
     root = Path(project_root)
-    parsed_answers = parse_answer_flags(tuple(answers or []))
+    parsed_answers = parse_answer_flags(answers or ())
     session, questions = interrogate_iteration(
         project_root=root,
         idea=idea,
@@ -5,6 +5,8 @@ Covers: 1.1, 1.2, 1.3, 1.4, and 2.1 (new command).
 
 import json
 import os
+import re
+import shutil
 from pathlib import Path
 
 import pytest
@@ -14,6 +16,9 @@ from spec_eng.cli import cli
 
 pytestmark = pytest.mark.acceptance
 
+_INITIALIZED_RE = re.compile(r"initialized", re.IGNORECASE)
+_REINIT_WARNING_RE = re.compile(r"(?i:already initialized)|Warning")
+
 
 @pytest.fixture
 def runner() -> CliRunner:
@@ -27,6 +32,36 @@ def in_tmp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="module")
+def initialized_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project initialized once per module with `spec-eng init`."""
+    template = tmp_path_factory.mktemp("initialized")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(template)
+        result = CliRunner().invoke(cli, ["--non-interactive", "init"])
+    assert result.exit_code == 0, result.output
+    return template
+
+
+@pytest.fixture
+def initialized(in_tmp: Path, initialized_template: Path) -> Path:
+    """Set cwd to a fresh copy of the initialized template project."""
+    shutil.copytree(initialized_template, in_tmp, dirs_exist_ok=True)
+    return in_tmp
+
+
+@pytest.fixture(scope="class")
+def python_config(tmp_path_factory: pytest.TempPathFactory) -> dict:
+    """Config written by one `spec-eng init` in a pytest-configured Python project."""
+    project = tmp_path_factory.mktemp("python-project")
+    (project / "pyproject.toml").write_text("[tool.pytest.ini_options]\n")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(project)
+        result = CliRunner().invoke(cli, ["init"])
+    assert result.exit_code == 0, result.output
+    return json.loads((project / ".spec-eng" / "config.json").read_bytes())
+
+
 class TestScenario1_1:
     """1.1: A new project can be initialized for spec engineering."""
 
@@ -39,7 +74,7 @@ class TestScenario1_1:
         runner.invoke(cli, ["--non-interactive", "init"])
         config_path = in_tmp / ".spec-eng" / "config.json"
         assert config_path.exists()
-        data = json.loads(config_path.read_text())
+        data = json.loads(config_path.read_bytes())
         assert "version" in data
 
     def test_specs_dir_created(self, runner: CliRunner, in_tmp: Path) -> None:
@@ -48,23 +83,17 @@ class TestScenario1_1:
 
     def test_confirmation_message(self, runner: CliRunner, in_tmp: Path) -> None:
         result = runner.invoke(cli, ["--non-interactive", "init"])
-        assert "Initialized" in result.output or "initialized" in result.output.lower()
+        assert _INITIALIZED_RE.search(result.output)
 
 
 class TestScenario1_2:
     """1.2: Initialization detects existing project language and framework."""
 
-    def test_detects_python(self, runner: CliRunner, in_tmp: Path) -> None:
-        (in_tmp / "pyproject.toml").write_text("[tool.pytest.ini_options]\n")
-        result = runner.invoke(cli, ["init"])
-        config = json.loads((in_tmp / ".spec-eng" / "config.json").read_text())
-        assert config["language"] == "python"
+    def test_detects_python(self, python_config: dict) -> None:
+        assert python_config["language"] == "python"
 
-    def test_detects_pytest(self, runner: CliRunner, in_tmp: Path) -> None:
-        (in_tmp / "pyproject.toml").write_text("[tool.pytest.ini_options]\n")
-        result = runner.invoke(cli, ["init"])
-        config = json.loads((in_tmp / ".spec-eng" / "config.json").read_text())
-        assert config["framework"] == "pytest"
+    def test_detects_pytest(self, python_config: dict) -> None:
+        assert python_config["framework"] == "pytest"
 
 
 class TestScenario1_3:
@@ -73,8 +102,8 @@ class TestScenario1_3:
     def test_detects_both(self, runner: CliRunner, in_tmp: Path) -> None:
         (in_tmp / "app.ts").write_text("export const x = 1;")
         (in_tmp / "Cargo.toml").write_text("[package]\nname = 'test'\n")
-        result = runner.invoke(cli, ["init"])
-        config = json.loads((in_tmp / ".spec-eng" / "config.json").read_text())
+        runner.invoke(cli, ["init"])
+        config = json.loads((in_tmp / ".spec-eng" / "config.json").read_bytes())
         # At least one language detected
         assert config["language"] in ("typescript", "rust")
 
@@ -82,49 +111,42 @@ class TestScenario1_3:
 class TestScenario1_4:
     """1.4: Re-initialization does not destroy existing specs."""
 
-    def test_existing_specs_preserved(self, runner: CliRunner, in_tmp: Path) -> None:
-        # First init
-        runner.invoke(cli, ["--non-interactive", "init"])
+    def test_existing_specs_preserved(self, runner: CliRunner, initialized: Path) -> None:
         # Create spec files
-        specs_dir = in_tmp / "specs"
+        specs_dir = initialized / "specs"
         for i in range(5):
             (specs_dir / f"spec-{i}.gwt").write_text(f"; Spec {i}\n")
 
         # Re-init
-        result = runner.invoke(cli, ["--non-interactive", "init"])
+        runner.invoke(cli, ["--non-interactive", "init"])
         # All 5 files still there
-        assert len(list(specs_dir.glob("*.gwt"))) == 5
+        assert sum(1 for p in specs_dir.iterdir() if p.suffix == ".gwt") == 5
 
-    def test_config_updated(self, runner: CliRunner, in_tmp: Path) -> None:
-        runner.invoke(cli, ["--non-interactive", "init"])
+    def test_config_updated(self, runner: CliRunner, initialized: Path) -> None:
         runner.invoke(cli, ["--non-interactive", "init"])
-        assert (in_tmp / ".spec-eng" / "config.json").exists()
+        assert (initialized / ".spec-eng" / "config.json").exists()
 
-    def test_warning_shown(self, runner: CliRunner, in_tmp: Path) -> None:
-        runner.invoke(cli, ["--non-interactive", "init"])
+    def test_warning_shown(self, runner: CliRunner, initialized: Path) -> None:
         result = runner.invoke(cli, ["--non-interactive", "init"])
-        assert "already initialized" in result.output.lower() or "Warning" in result.output
+        assert _REINIT_WARNING_RE.search(result.output)
 
 
 class TestScenario2_1:
     """2.1: A new spec file can be created from a description."""
 
-    def test_new_creates_file(self, runner: CliRunner, in_tmp: Path) -> None:
-        runner.invoke(cli, ["--non-interactive", "init"])
+    def test_new_creates_file(self, runner: CliRunner, initialized: Path) -> None:
         result = runner.invoke(cli, ["new", "User Registration"])
         assert result.exit_code == 0
-        assert (in_tmp / "specs" / "user-registration.gwt").exists()
+        assert (initialized / "specs" / "user-registration.gwt").exists()
 
-    def test_file_has_header(self, runner: CliRunner, in_tmp: Path) -> None:
-        runner.invoke(cli, ["--non-interactive", "init"])
+    def test_file_has_header(self, runner: CliRunner, initialized: Path) -> None:
         runner.invoke(cli, ["new", "User Registration"])
-        content = (in_tmp / "specs" / "user-registration.gwt").read_text()
+        content = (initialized / "specs" / "user-registration.gwt").read_text()
         assert "User Registration" in content
 
-    def test_file_has_scaffold(self, runner: CliRunner, in_tmp: Path) -> None:
-        runner.invoke(cli, ["--non-interactive", "init"])
+    def test_file_has_scaffold(self, runner: CliRunner, initialized: Path) -> None:
         runner.invoke(cli, ["new", "User Registration"])
-        content = (in_tmp / "specs" / "user-registration.gwt").read_text()
+        content = (initialized / "specs" / "user-registration.gwt").read_text()
         assert "GIVEN" in content
         assert "WHEN" in content
         assert "THEN" in content
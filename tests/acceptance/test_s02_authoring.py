@@ -5,16 +5,12 @@ Covers: 2.3, 2.4, 2.6 (parser-related). 2.1 tested in test_s01. 2.2 tested in Ph
 
 import pytest
 
+from spec_eng.models import ParseResult
 from spec_eng.parser import parse_gwt_string
 
 pytestmark = pytest.mark.acceptance
 
-
-class TestScenario2_3:
-    """2.3: GWT files follow the required format."""
-
-    def test_single_scenario_extracted(self) -> None:
-        content = """\
+_REGISTER_CONTENT = """\
 ;===============================================================
 ; User can register with email and password.
 ;===============================================================
@@ -25,68 +21,46 @@ WHEN a user registers with email "bob@example.com" and password "secret123".
 THEN there is 1 registered user.
 THEN the user "bob@example.com" can log in.
 """
-        result = parse_gwt_string(content)
-        assert len(result.scenarios) == 1
 
-    def test_one_given_clause(self) -> None:
-        content = """\
+_MISSING_WHEN_CONTENT = """\
 ;===============================================================
-; User can register with email and password.
+; Missing when.
 ;===============================================================
-GIVEN no registered users.
-
-WHEN a user registers with email "bob@example.com" and password "secret123".
+GIVEN something.
 
-THEN there is 1 registered user.
-THEN the user "bob@example.com" can log in.
+THEN a result.
 """
-        result = parse_gwt_string(content)
-        assert len(result.scenarios[0].givens) == 1
 
-    def test_one_when_clause(self) -> None:
-        content = """\
-;===============================================================
-; User can register with email and password.
-;===============================================================
-GIVEN no registered users.
 
-WHEN a user registers with email "bob@example.com" and password "secret123".
+@pytest.fixture(scope="module")
+def registered() -> ParseResult:
+    """The registration scenario, parsed once for the module."""
+    return parse_gwt_string(_REGISTER_CONTENT)
 
-THEN there is 1 registered user.
-THEN the user "bob@example.com" can log in.
-"""
-        result = parse_gwt_string(content)
-        assert len(result.scenarios[0].whens) == 1
 
-    def test_two_then_clauses(self) -> None:
-        content = """\
-;===============================================================
-; User can register with email and password.
-;===============================================================
-GIVEN no registered users.
+@pytest.fixture(scope="module")
+def missing_when() -> ParseResult:
+    """A scenario without a WHEN clause, parsed once for the module."""
+    return parse_gwt_string(_MISSING_WHEN_CONTENT, source_file="bad.gwt")
 
-WHEN a user registers with email "bob@example.com" and password "secret123".
 
-THEN there is 1 registered user.
-THEN the user "bob@example.com" can log in.
-"""
-        result = parse_gwt_string(content)
-        assert len(result.scenarios[0].thens) == 2
+class TestScenario2_3:
+    """2.3: GWT files follow the required format."""
 
-    def test_scenario_title(self) -> None:
-        content = """\
-;===============================================================
-; User can register with email and password.
-;===============================================================
-GIVEN no registered users.
+    def test_single_scenario_extracted(self, registered: ParseResult) -> None:
+        assert len(registered.scenarios) == 1
 
-WHEN a user registers with email "bob@example.com" and password "secret123".
+    def test_one_given_clause(self, registered: ParseResult) -> None:
+        assert len(registered.scenarios[0].givens) == 1
 
-THEN there is 1 registered user.
-THEN the user "bob@example.com" can log in.
-"""
-        result = parse_gwt_string(content)
-        assert result.scenarios[0].title == "User can register with email and password."
+    def test_one_when_clause(self, registered: ParseResult) -> None:
+        assert len(registered.scenarios[0].whens) == 1
+
+    def test_two_then_clauses(self, registered: ParseResult) -> None:
+        assert len(registered.scenarios[0].thens) == 2
+
+    def test_scenario_title(self, registered: ParseResult) -> None:
+        assert registered.scenarios[0].title == "User can register with email and password."
 
 
 class TestScenario2_4:
@@ -161,51 +135,15 @@ THEN i.
 class TestScenario2_6:
     """2.6: Invalid GWT syntax is rejected with a helpful error."""
 
-    def test_missing_when_fails(self) -> None:
-        content = """\
-;===============================================================
-; Missing when.
-;===============================================================
-GIVEN something.
+    def test_missing_when_fails(self, missing_when: ParseResult) -> None:
+        assert not missing_when.is_success
 
-THEN a result.
-"""
-        result = parse_gwt_string(content, source_file="bad.gwt")
-        assert not result.is_success
+    def test_error_identifies_file(self, missing_when: ParseResult) -> None:
+        assert missing_when.errors[0].source_file == "bad.gwt"
 
-    def test_error_identifies_file(self) -> None:
-        content = """\
-;===============================================================
-; Missing when.
-;===============================================================
-GIVEN something.
+    def test_error_identifies_line(self, missing_when: ParseResult) -> None:
+        assert missing_when.errors[0].line_number > 0
 
-THEN a result.
-"""
-        result = parse_gwt_string(content, source_file="bad.gwt")
-        assert result.errors[0].source_file == "bad.gwt"
-
-    def test_error_identifies_line(self) -> None:
-        content = """\
-;===============================================================
-; Missing when.
-;===============================================================
-GIVEN something.
-
-THEN a result.
-"""
-        result = parse_gwt_string(content, source_file="bad.gwt")
-        assert result.errors[0].line_number > 0
-
-    def test_error_explains_requirement(self) -> None:
-        content = """\
-;===============================================================
-; Missing when.
-;===============================================================
-GIVEN something.
-
-THEN a result.
-"""
-        result = parse_gwt_string(content, source_file="bad.gwt")
-        msg = result.errors[0].message.lower()
+    def test_error_explains_requirement(self, missing_when: ParseResult) -> None:
+        msg = missing_when.errors[0].message.lower()
         assert "when" in msg
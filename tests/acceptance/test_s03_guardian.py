@@ -9,23 +9,43 @@ from pathlib import Path
 import pytest
 
 from spec_eng.guardian import analyze_clause, analyze_scenario
-from spec_eng.models import Clause, Scenario
+from spec_eng.models import Clause, GuardianWarning, Scenario
 
 pytestmark = pytest.mark.acceptance
 
+_USER_SERVICE = "the UserService has no users"
+_USERS_TABLE = "the users table contains 1 row"
+_POST_REQUEST = "a POST request is sent to /api/users"
+_REDIS_CACHE = "the Redis cache is empty"
+
+_WarningsByText = dict[str, list[GuardianWarning]]
+
+
+@pytest.fixture(scope="module")
+def leaky_warnings() -> _WarningsByText:
+    """Warnings for one scenario holding every leaky clause, grouped by clause text."""
+    scenario = Scenario(
+        title="Leaky spec",
+        givens=[Clause("GIVEN", _USER_SERVICE, 1), Clause("GIVEN", _REDIS_CACHE, 2)],
+        whens=[Clause("WHEN", _POST_REQUEST, 3)],
+        thens=[Clause("THEN", _USERS_TABLE, 4)],
+    )
+    grouped: _WarningsByText = {}
+    for w in analyze_scenario(scenario):
+        grouped.setdefault(w.original_text, []).append(w)
+    return grouped
+
 
 class TestScenario3_1:
     """3.1: The guardian detects class/module names in specs."""
 
-    def test_warns_for_userservice(self) -> None:
-        clause = Clause("GIVEN", "the UserService has no users", 1)
-        warnings = analyze_clause(clause)
+    def test_warns_for_userservice(self, leaky_warnings: _WarningsByText) -> None:
+        warnings = leaky_warnings[_USER_SERVICE]
         flagged = [t for w in warnings for t in w.flagged_terms]
         assert any("UserService" in t for t in flagged)
 
-    def test_suggests_behavioral_alternative(self) -> None:
-        clause = Clause("GIVEN", "the UserService has no users", 1)
-        warnings = analyze_clause(clause)
+    def test_suggests_behavioral_alternative(self, leaky_warnings: _WarningsByText) -> None:
+        warnings = leaky_warnings[_USER_SERVICE]
         suggestions = [w.suggested_alternative for w in warnings]
         assert any("user" in s.lower() for s in suggestions)
 
@@ -39,16 +59,14 @@ class TestScenario3_1:
 class TestScenario3_2:
     """3.2: The guardian detects database terminology."""
 
-    def test_warns_for_table_and_row(self) -> None:
-        clause = Clause("THEN", "the users table contains 1 row", 1)
-        warnings = analyze_clause(clause)
+    def test_warns_for_table_and_row(self, leaky_warnings: _WarningsByText) -> None:
+        warnings = leaky_warnings[_USERS_TABLE]
         flagged = [t for w in warnings for t in w.flagged_terms]
         assert any("table" in t.lower() for t in flagged)
         assert any("row" in t.lower() for t in flagged)
 
-    def test_suggests_behavioral(self) -> None:
-        clause = Clause("THEN", "the users table contains 1 row", 1)
-        warnings = analyze_clause(clause)
+    def test_suggests_behavioral(self, leaky_warnings: _WarningsByText) -> None:
+        warnings = leaky_warnings[_USERS_TABLE]
         suggestions = [w.suggested_alternative for w in warnings]
         assert any("user" in s.lower() or "record" in s.lower() for s in suggestions)
 
@@ -56,15 +74,13 @@ class TestScenario3_2:
 class TestScenario3_3:
     """3.3: The guardian detects API/protocol terminology."""
 
-    def test_warns_for_post_request(self) -> None:
-        clause = Clause("WHEN", "a POST request is sent to /api/users", 1)
-        warnings = analyze_clause(clause)
+    def test_warns_for_post_request(self, leaky_warnings: _WarningsByText) -> None:
+        warnings = leaky_warnings[_POST_REQUEST]
         flagged = [t for w in warnings for t in w.flagged_terms]
         assert any("POST" in t for t in flagged) or any("/api/" in t for t in flagged)
 
-    def test_suggests_behavioral(self) -> None:
-        clause = Clause("WHEN", "a POST request is sent to /api/users", 1)
-        warnings = analyze_clause(clause)
+    def test_suggests_behavioral(self, leaky_warnings: _WarningsByText) -> None:
+        warnings = leaky_warnings[_POST_REQUEST]
         suggestions = [w.suggested_alternative for w in warnings]
         assert any("register" in s.lower() or "action" in s.lower() for s in suggestions)
 
@@ -72,15 +88,13 @@ class TestScenario3_3:
 class TestScenario3_4:
     """3.4: The guardian detects framework-specific terminology."""
 
-    def test_warns_for_redis_cache(self) -> None:
-        clause = Clause("GIVEN", "the Redis cache is empty", 1)
-        warnings = analyze_clause(clause)
+    def test_warns_for_redis_cache(self, leaky_warnings: _WarningsByText) -> None:
+        warnings = leaky_warnings[_REDIS_CACHE]
         flagged = [t for w in warnings for t in w.flagged_terms]
         assert any("Redis" in t for t in flagged)
 
-    def test_suggests_behavioral(self) -> None:
-        clause = Clause("GIVEN", "the Redis cache is empty", 1)
-        warnings = analyze_clause(clause)
+    def test_suggests_behavioral(self, leaky_warnings: _WarningsByText) -> None:
+        warnings = leaky_warnings[_REDIS_CACHE]
         suggestions = [w.suggested_alternative for w in warnings]
         assert any("cache" in s.lower() or "session" in s.lower() for s in suggestions)
 
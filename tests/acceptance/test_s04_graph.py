@@ -4,12 +4,19 @@ Covers: 4.1 - 4.9.
 """
 
 import json
+import re
+from functools import lru_cache
 
 import pytest
 
 from spec_eng.exporters.dot import export_dot
-from spec_eng.graph import build_graph, find_semantic_equivalences, graph_to_json
-from spec_eng.models import Clause, ParseResult, Scenario
+from spec_eng.graph import (
+    build_graph,
+    find_semantic_equivalences,
+    graph_to_json,
+    update_graph_incremental,
+)
+from spec_eng.models import Clause, GraphModel, ParseResult, Scenario
 from spec_eng.parser import parse_gwt_string
 
 pytestmark = pytest.mark.acceptance
@@ -24,30 +31,52 @@ def _make_scenario(title: str, given: str, when: str, then: str) -> Scenario:
     )
 
 
+# Scenarios as (title, given, when, then), shared by tests that build the same graph
+_REGISTER = ("S1", "no registered users", "a user registers", "1 registered user")
+_REGISTER_THEN_LOGIN = (
+    ("S1", "no users", "register", "1 user"),
+    ("S2", "1 user", "login", "logged in"),
+)
+_START_TO_END = ("S1", "start", "go", "end")
+_A_TO_B = ("S1", "a", "event", "b")
+# Chains state_0 -> state_1 -> ... through one scenario per step
+_LINEAR_10 = tuple((f"S{i}", f"state_{i}", f"event_{i}", f"state_{i+1}") for i in range(10))
+_LINEAR_8 = tuple((f"S{i}", f"state_{i}", f"evt_{i}", f"state_{i+1}") for i in range(8))
+
+
+@lru_cache(maxsize=64)
+def _graph_of(*specs: tuple[str, str, str, str]) -> GraphModel:
+    """Graph model of the given (title, given, when, then) scenarios."""
+    return build_graph(ParseResult(scenarios=[_make_scenario(*spec) for spec in specs]))
+
+
+@pytest.fixture(scope="class")
+def chain_dot() -> str:
+    """DOT export of the 8-step linear chain."""
+    return export_dot(_graph_of(*_LINEAR_8))
+
+
+@pytest.fixture(scope="class")
+def start_end_dot() -> str:
+    """DOT export of a single start -> end scenario."""
+    return export_dot(_graph_of(_START_TO_END))
+
+
 class TestScenario4_1:
     """4.1: A state machine graph is built from a single spec file."""
 
     def test_two_states(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "no registered users", "a user registers", "1 registered user"),
-        ])
-        gm = build_graph(result)
+        gm = _graph_of(_REGISTER)
         assert "no registered users" in gm.states
         assert "1 registered user" in gm.states
 
     def test_one_transition(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "no registered users", "a user registers", "1 registered user"),
-        ])
-        gm = build_graph(result)
+        gm = _graph_of(_REGISTER)
         assert len(gm.transitions) == 1
         assert gm.transitions[0].event == "a user registers"
 
     def test_transition_direction(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "no registered users", "a user registers", "1 registered user"),
-        ])
-        gm = build_graph(result)
+        gm = _graph_of(_REGISTER)
         t = gm.transitions[0]
         assert t.from_state == "no registered users"
         assert t.to_state == "1 registered user"
@@ -57,20 +86,11 @@ class TestScenario4_2:
     """4.2: The graph aggregates scenarios across multiple spec files."""
 
     def test_all_scenarios_contribute(self) -> None:
-        scenarios = [
-            _make_scenario(f"S{i}", f"state_{i}", f"event_{i}", f"state_{i+1}")
-            for i in range(10)
-        ]
-        result = ParseResult(scenarios=scenarios)
-        gm = build_graph(result)
+        gm = _graph_of(*_LINEAR_10)
         assert len(gm.transitions) == 10
 
     def test_states_merged_by_label(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "no users", "register", "1 user"),
-            _make_scenario("S2", "1 user", "login", "logged in"),
-        ])
-        gm = build_graph(result)
+        gm = _graph_of(*_REGISTER_THEN_LOGIN)
         assert len(gm.states["1 user"].source_scenarios) == 2
 
 
@@ -125,64 +145,33 @@ class TestScenario4_6:
     """4.6: The graph identifies terminal states."""
 
     def test_terminal_states_identified(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "no users", "register", "1 user"),
-            _make_scenario("S2", "1 user", "login", "logged in"),
-        ])
-        gm = build_graph(result)
+        gm = _graph_of(*_REGISTER_THEN_LOGIN)
         assert "logged in" in gm.terminal_states
 
 
 class TestScenario4_7:
     """4.7: The graph can be exported as DOT."""
 
-    def test_dot_has_all_states(self) -> None:
-        scenarios = [
-            _make_scenario(f"S{i}", f"state_{i}", f"evt_{i}", f"state_{i+1}")
-            for i in range(8)
-        ]
-        result = ParseResult(scenarios=scenarios)
-        gm = build_graph(result)
-        dot = export_dot(gm)
-        for i in range(9):
-            assert f"state_{i}" in dot
-
-    def test_dot_has_all_transitions(self) -> None:
-        scenarios = [
-            _make_scenario(f"S{i}", f"state_{i}", f"evt_{i}", f"state_{i+1}")
-            for i in range(8)
-        ]
-        result = ParseResult(scenarios=scenarios)
-        gm = build_graph(result)
-        dot = export_dot(gm)
+    def test_dot_has_all_states(self, chain_dot: str) -> None:
+        found = set(re.findall(r"state_\d+", chain_dot))
+        assert {f"state_{i}" for i in range(9)} <= found
+
+    def test_dot_has_all_transitions(self, chain_dot: str) -> None:
         # 8 transitions as labeled edges
-        assert dot.count("->") >= 8
+        assert chain_dot.count("->") >= 8
 
-    def test_entry_points_distinguished(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "start", "go", "end"),
-        ])
-        gm = build_graph(result)
-        dot = export_dot(gm)
-        assert "doublecircle" in dot
+    def test_entry_points_distinguished(self, start_end_dot: str) -> None:
+        assert "doublecircle" in start_end_dot
 
-    def test_terminal_states_distinguished(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "start", "go", "end"),
-        ])
-        gm = build_graph(result)
-        dot = export_dot(gm)
-        assert "bold" in dot
+    def test_terminal_states_distinguished(self, start_end_dot: str) -> None:
+        assert "bold" in start_end_dot
 
 
 class TestScenario4_8:
     """4.8: The graph can be exported as JSON."""
 
     def test_json_structure(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "a", "event", "b"),
-        ])
-        gm = build_graph(result)
+        gm = _graph_of(_A_TO_B)
         data = graph_to_json(gm)
         assert "states" in data
         assert "transitions" in data
@@ -190,18 +179,12 @@ class TestScenario4_8:
         assert "terminal_states" in data
 
     def test_json_source_refs_states(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "a", "event", "b"),
-        ])
-        gm = build_graph(result)
+        gm = _graph_of(_A_TO_B)
         data = graph_to_json(gm)
         assert "source_scenarios" in data["states"]["a"]
 
     def test_json_source_refs_transitions(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "a", "event", "b"),
-        ])
-        gm = build_graph(result)
+        gm = _graph_of(_A_TO_B)
         data = graph_to_json(gm)
         assert data["transitions"][0]["source_scenario"] == "S1"
 
@@ -210,12 +193,7 @@ class TestScenario4_9:
     """4.9: The graph updates incrementally when specs change."""
 
     def test_incremental_update(self) -> None:
-        from spec_eng.graph import update_graph_incremental
-
-        existing = build_graph(ParseResult(scenarios=[
-            _make_scenario("S1", "a", "e1", "b"),
-            _make_scenario("S2", "b", "e2", "c"),
-        ]))
+        existing = _graph_of(("S1", "a", "e1", "b"), ("S2", "b", "e2", "c"))
         new_scenarios = [
             _make_scenario("S3", "c", "e3", "d"),
             _make_scenario("S4", "d", "e4", "e"),
@@ -224,11 +202,7 @@ class TestScenario4_9:
         assert len(updated.transitions) == 4
 
     def test_unmodified_data_preserved(self) -> None:
-        from spec_eng.graph import update_graph_incremental
-
-        existing = build_graph(ParseResult(scenarios=[
-            _make_scenario("S1", "a", "e1", "b"),
-        ]))
+        existing = _graph_of(("S1", "a", "e1", "b"))
         new_scenarios = [_make_scenario("S2", "c", "e2", "d")]
         updated = update_graph_incremental(existing, new_scenarios, "new.gwt")
         # Original transition preserved
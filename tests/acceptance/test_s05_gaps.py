@@ -4,6 +4,7 @@ Covers: 5.1 - 5.11 (5.10 AI suggestion mocked).
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -24,25 +25,35 @@ def _make_scenario(title: str, given: str, when: str, then: str) -> Scenario:
     )
 
 
+@lru_cache(maxsize=64)
+def _gaps_of(*specs: tuple[str, str, str, str]) -> tuple[Gap, ...]:
+    """Gaps found in the given (title, given, when, then) scenarios."""
+    result = ParseResult(scenarios=[_make_scenario(*spec) for spec in specs])
+    return tuple(analyze_gaps(build_graph(result)))
+
+
+@lru_cache(maxsize=64)
+def _gaps_by_type(*specs: tuple[str, str, str, str]) -> dict[GapType, tuple[Gap, ...]]:
+    """The gaps of _gaps_of(*specs), bucketed by gap type in one pass."""
+    buckets: dict[GapType, list[Gap]] = {}
+    for gap in _gaps_of(*specs):
+        buckets.setdefault(gap.gap_type, []).append(gap)
+    return {gap_type: tuple(gaps) for gap_type, gaps in buckets.items()}
+
+
 class TestScenario5_1:
     """5.1: Dead-end states are identified."""
 
     def test_dead_end_in_report(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "a", "go", "user is locked out"),
-        ])
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
-        dead_ends = [g for g in gaps if g.gap_type == GapType.DEAD_END]
+        dead_ends = _gaps_by_type(("S1", "a", "go", "user is locked out")).get(
+            GapType.DEAD_END, ()
+        )
         assert any("user is locked out" in g.description for g in dead_ends)
 
     def test_asks_if_intentional(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "a", "go", "user is locked out"),
-        ])
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
-        dead_ends = [g for g in gaps if g.gap_type == GapType.DEAD_END]
+        dead_ends = _gaps_by_type(("S1", "a", "go", "user is locked out")).get(
+            GapType.DEAD_END, ()
+        )
         assert any("intentional" in g.question.lower() for g in dead_ends)
 
 
@@ -85,23 +96,17 @@ class TestScenario5_3:
     """5.3: Missing error transitions are identified."""
 
     def test_missing_error_noted(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "user is logged in", "logs out", "logged out"),
-            _make_scenario("S2", "user is logged in", "views profile", "profile shown"),
-        ])
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
-        missing_err = [g for g in gaps if g.gap_type == GapType.MISSING_ERROR]
+        missing_err = _gaps_by_type(
+            ("S1", "user is logged in", "logs out", "logged out"),
+            ("S2", "user is logged in", "views profile", "profile shown"),
+        ).get(GapType.MISSING_ERROR, ())
         assert any("user is logged in" in g.description for g in missing_err)
 
     def test_suggests_error_question(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "user is logged in", "logs out", "logged out"),
-            _make_scenario("S2", "user is logged in", "views profile", "profile shown"),
-        ])
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
-        missing_err = [g for g in gaps if g.gap_type == GapType.MISSING_ERROR]
+        missing_err = _gaps_by_type(
+            ("S1", "user is logged in", "logs out", "logged out"),
+            ("S2", "user is logged in", "views profile", "profile shown"),
+        ).get(GapType.MISSING_ERROR, ())
         assert any("error" in g.question.lower() for g in missing_err)
 
 
@@ -109,23 +114,17 @@ class TestScenario5_4:
     """5.4: Contradictory postconditions are identified."""
 
     def test_contradiction_flagged(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("A", "1 user", "user registers", "there are 2 users"),
-            _make_scenario("B", "1 user", "user registers", "registration fails"),
-        ])
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
-        contradictions = [g for g in gaps if g.gap_type == GapType.CONTRADICTION]
+        contradictions = _gaps_by_type(
+            ("A", "1 user", "user registers", "there are 2 users"),
+            ("B", "1 user", "user registers", "registration fails"),
+        ).get(GapType.CONTRADICTION, ())
         assert len(contradictions) > 0
 
     def test_asks_about_missing_condition(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("A", "1 user", "user registers", "2 users"),
-            _make_scenario("B", "1 user", "user registers", "registration fails"),
-        ])
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
-        contradictions = [g for g in gaps if g.gap_type == GapType.CONTRADICTION]
+        contradictions = _gaps_by_type(
+            ("A", "1 user", "user registers", "2 users"),
+            ("B", "1 user", "user registers", "registration fails"),
+        ).get(GapType.CONTRADICTION, ())
         assert any("missing condition" in g.question.lower() for g in contradictions)
 
 
@@ -133,21 +132,15 @@ class TestScenario5_5:
     """5.5: Missing negative scenarios are suggested."""
 
     def test_suggests_negatives(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "no users", "user registers", "1 user"),
-        ])
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
-        negatives = [g for g in gaps if g.gap_type == GapType.MISSING_NEGATIVE]
+        negatives = _gaps_by_type(("S1", "no users", "user registers", "1 user")).get(
+            GapType.MISSING_NEGATIVE, ()
+        )
         assert len(negatives) > 0
 
     def test_negative_suggestions_relevant(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "no users", "user registers", "1 user"),
-        ])
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
-        negatives = [g for g in gaps if g.gap_type == GapType.MISSING_NEGATIVE]
+        negatives = _gaps_by_type(("S1", "no users", "user registers", "1 user")).get(
+            GapType.MISSING_NEGATIVE, ()
+        )
         assert any("fail" in g.question.lower() for g in negatives)
 
 
@@ -163,22 +156,16 @@ class TestScenario5_6:
         assert path.exists()
 
     def test_report_has_types(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "a", "e1", "b"),
-            _make_scenario("S2", "a", "e2", "c"),
-        ])
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
+        gaps = _gaps_of(
+            ("S1", "a", "e1", "b"),
+            ("S2", "a", "e2", "c"),
+        )
         for g in gaps:
             assert isinstance(g.gap_type, GapType)
             assert isinstance(g.severity, Severity)
 
     def test_report_has_references(self) -> None:
-        result = ParseResult(scenarios=[
-            _make_scenario("S1", "a", "e1", "b"),
-        ])
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
+        gaps = _gaps_of(("S1", "a", "e1", "b"))
         for g in gaps:
             assert g.question  # Each has a suggested question
 
@@ -202,24 +189,17 @@ class TestScenario5_8:
 
     def test_resolved_gaps_disappear(self) -> None:
         # First analysis: only positive scenario
-        result1 = ParseResult(scenarios=[
-            _make_scenario("S1", "no users", "registers", "1 user"),
-        ])
-        gm1 = build_graph(result1)
-        gaps1 = analyze_gaps(gm1)
+        neg1 = _gaps_by_type(("S1", "no users", "registers", "1 user")).get(
+            GapType.MISSING_NEGATIVE, ()
+        )
 
         # Second analysis: add error handling
-        result2 = ParseResult(scenarios=[
-            _make_scenario("S1", "no users", "registers", "1 user"),
-            _make_scenario("S2", "no users", "registers with invalid email", "error shown"),
-        ])
-        gm2 = build_graph(result2)
-        gaps2 = analyze_gaps(gm2)
-
-        # Should have fewer missing negative gaps
-        neg1 = [g for g in gaps1 if g.gap_type == GapType.MISSING_NEGATIVE]
-        neg2 = [g for g in gaps2 if g.gap_type == GapType.MISSING_NEGATIVE]
-        # The "no users" state now has a negative scenario
+        neg2 = _gaps_by_type(
+            ("S1", "no users", "registers", "1 user"),
+            ("S2", "no users", "registers with invalid email", "error shown"),
+        ).get(GapType.MISSING_NEGATIVE, ())
+
+        # Should have fewer missing negative gaps: "no users" now has a negative scenario
         no_users_neg1 = [g for g in neg1 if "no users" in g.description]
         no_users_neg2 = [g for g in neg2 if "no users" in g.description]
         # With the added negative scenario, the gap should be resolved
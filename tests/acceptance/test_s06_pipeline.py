@@ -4,6 +4,8 @@ Covers: 6.1 - 6.6.
 """
 
 import json
+import os
+import shutil
 from pathlib import Path
 
 import pytest
@@ -16,6 +18,9 @@ from spec_eng.pipeline import bootstrap_pipeline, is_bootstrapped
 
 pytestmark = pytest.mark.acceptance
 
+# Project root and the summary returned by bootstrapping it
+_Bootstrapped = tuple[Path, dict[str, str]]
+
 
 @pytest.fixture
 def py_project(tmp_path: Path) -> Path:
@@ -26,6 +31,21 @@ def py_project(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="module")
+def bootstrapped_project(
+    tmp_path_factory: pytest.TempPathFactory, minimal_spec: str
+) -> _Bootstrapped:
+    """A Python project with one spec, bootstrapped once per module, and its summary.
+
+    Tests that change the project work on a copy.
+    """
+    root = tmp_path_factory.mktemp("bootstrapped")
+    save_config(ProjectConfig(language="python", framework="pytest"), root)
+    (root / "specs").mkdir()
+    (root / "specs" / "test.gwt").write_text(minimal_spec)
+    return root, bootstrap_pipeline(root)
+
+
 def _write_spec(specs_dir: Path, name: str, content: str) -> Path:
     p = specs_dir / name
     p.write_text(content)
@@ -35,18 +55,12 @@ def _write_spec(specs_dir: Path, name: str, content: str) -> Path:
 class TestScenario6_1:
     """6.1: A parser/generator pipeline is bootstrapped."""
 
-    def test_parser_stored(self, py_project: Path) -> None:
-        (py_project / "specs" / "test.gwt").write_text(
-            ";===\n; Test.\n;===\nGIVEN a.\n\nWHEN b.\n\nTHEN c.\n"
-        )
-        bootstrap_pipeline(py_project)
-        assert (py_project / ".spec-eng" / "pipeline").is_dir()
-
-    def test_summary_shown(self, py_project: Path) -> None:
-        (py_project / "specs" / "test.gwt").write_text(
-            ";===\n; Test.\n;===\nGIVEN a.\n\nWHEN b.\n\nTHEN c.\n"
-        )
-        summary = bootstrap_pipeline(py_project)
+    def test_parser_stored(self, bootstrapped_project: _Bootstrapped) -> None:
+        root, _ = bootstrapped_project
+        assert (root / ".spec-eng" / "pipeline").is_dir()
+
+    def test_summary_shown(self, bootstrapped_project: _Bootstrapped) -> None:
+        _, summary = bootstrapped_project
         assert summary["language"] == "python"
         assert summary["framework"] == "pytest"
 
@@ -62,18 +76,17 @@ class TestScenario6_2:
                 f"GIVEN state {i}.\n\nWHEN event {i}.\n\nTHEN result {i}.\n"
             ))
 
+        # scandir filters on names without the per-entry Path objects glob builds
+        gwt_paths = sorted(e.path for e in os.scandir(specs_dir) if e.name.endswith(".gwt"))
         all_scenarios = []
-        for gwt_file in sorted(specs_dir.glob("*.gwt")):
-            r = parse_gwt_file(gwt_file)
-            all_scenarios.extend(r.scenarios)
+        for gwt_path in gwt_paths:
+            all_scenarios.extend(parse_gwt_file(Path(gwt_path)).scenarios)
 
         assert len(all_scenarios) == 5
 
-    def test_ir_has_source_refs(self, py_project: Path) -> None:
+    def test_ir_has_source_refs(self, py_project: Path, minimal_spec: str) -> None:
         specs_dir = py_project / "specs"
-        _write_spec(specs_dir, "reg.gwt", (
-            ";===\n; Test.\n;===\nGIVEN a.\n\nWHEN b.\n\nTHEN c.\n"
-        ))
+        _write_spec(specs_dir, "reg.gwt", minimal_spec)
         r = parse_gwt_file(specs_dir / "reg.gwt")
         ir = generate_ir(r)
         assert ir[0]["source_file"] is not None
@@ -105,23 +118,18 @@ class TestScenario6_3:
 class TestScenario6_4:
     """6.4: The pipeline can be re-bootstrapped."""
 
-    def test_refresh(self, py_project: Path) -> None:
-        (py_project / "specs" / "t.gwt").write_text(
-            ";===\n; T.\n;===\nGIVEN a.\n\nWHEN b.\n\nTHEN c.\n"
-        )
-        bootstrap_pipeline(py_project)
-        summary = bootstrap_pipeline(py_project, refresh=True)
+    def test_refresh(self, bootstrapped_project: _Bootstrapped, tmp_path: Path) -> None:
+        root, _ = bootstrapped_project
+        shutil.copytree(root, tmp_path, dirs_exist_ok=True)
+        summary = bootstrap_pipeline(tmp_path, refresh=True)
         assert summary["validation"] == "passed"
 
 
 class TestScenario6_5:
     """6.5: The pipeline validates itself against a reference spec."""
 
-    def test_validation_passes(self, py_project: Path) -> None:
-        (py_project / "specs" / "t.gwt").write_text(
-            ";===\n; T.\n;===\nGIVEN a.\n\nWHEN b.\n\nTHEN c.\n"
-        )
-        summary = bootstrap_pipeline(py_project)
+    def test_validation_passes(self, bootstrapped_project: _Bootstrapped) -> None:
+        _, summary = bootstrapped_project
         assert summary["validation"] == "passed"
 
 
@@ -3,6 +3,7 @@
 Covers: 7.1 - 7.5.
 """
 
+import os
 from pathlib import Path
 
 import pytest
@@ -14,6 +15,9 @@ from spec_eng.runner import TestResult, run_acceptance_tests
 
 pytestmark = pytest.mark.acceptance
 
+# Generated test files by name, and the result of running them
+_GeneratedRun = tuple[dict[str, str], TestResult]
+
 
 def _setup_project(tmp_path: Path) -> Path:
     config = ProjectConfig(language="python", framework="pytest")
@@ -33,16 +37,24 @@ def _make_scenario(title: str, given: str, when: str, then: str, source: str = "
     )
 
 
+@pytest.fixture(scope="module")
+def generated_run(tmp_path_factory: pytest.TempPathFactory) -> _GeneratedRun:
+    """Generate tests for one scenario and run them once per module.
+
+    Tests that modify the project or need it without generated tests set up their own.
+    """
+    proj = _setup_project(tmp_path_factory.mktemp("generated"))
+    generated = generate_tests(proj, ParseResult(scenarios=[
+        _make_scenario("Test", "a", "b", "c"),
+    ]))
+    return generated, run_acceptance_tests(proj)
+
+
 class TestScenario7_1:
     """7.1: Generated tests execute and report results."""
 
-    def test_results_show_counts(self, tmp_path: Path) -> None:
-        proj = _setup_project(tmp_path)
-        result = ParseResult(scenarios=[
-            _make_scenario("Test", "a", "b", "c"),
-        ])
-        generate_tests(proj, result)
-        test_result = run_acceptance_tests(proj)
+    def test_results_show_counts(self, generated_run: _GeneratedRun) -> None:
+        _, test_result = generated_run
         # Tests exist and report something
         assert test_result.total > 0 or "No generated tests" not in test_result.output
 
@@ -53,25 +65,23 @@ class TestScenario7_3:
     Tested by verifying the regeneration logic exists.
     """
 
-    def test_stale_detection(self, tmp_path: Path) -> None:
-        import time
-
+    def test_stale_detection(self, tmp_path: Path, minimal_spec: str) -> None:
         proj = _setup_project(tmp_path)
         specs_dir = proj / "specs"
-        (specs_dir / "test.gwt").write_text(
-            ";===\n; Test.\n;===\nGIVEN a.\n\nWHEN b.\n\nTHEN c.\n"
-        )
+        (specs_dir / "test.gwt").write_text(minimal_spec)
 
         result = ParseResult(scenarios=[
             _make_scenario("Test", "a", "b", "c"),
         ])
         generate_tests(proj, result)
 
-        # Modify spec (make it newer)
-        time.sleep(0.1)
-        (specs_dir / "test.gwt").write_text(
+        # Modify spec and date it after the generated test, without sleeping
+        spec_file = specs_dir / "test.gwt"
+        spec_file.write_text(
             ";===\n; Updated.\n;===\nGIVEN x.\n\nWHEN y.\n\nTHEN z.\n"
         )
+        generated_mtime = (proj / ".spec-eng" / "generated" / "test_test.py").stat().st_mtime
+        os.utime(spec_file, (generated_mtime + 1, generated_mtime + 1))
 
         # Running acceptance tests should trigger regeneration
         run_acceptance_tests(proj)
@@ -94,11 +104,7 @@ class TestScenario7_4:
 class TestScenario7_5:
     """7.5: Generated test files are never manually edited."""
 
-    def test_do_not_edit_warning_in_file(self, tmp_path: Path) -> None:
-        proj = _setup_project(tmp_path)
-        result = ParseResult(scenarios=[
-            _make_scenario("Test", "a", "b", "c"),
-        ])
-        generated = generate_tests(proj, result)
+    def test_do_not_edit_warning_in_file(self, generated_run: _GeneratedRun) -> None:
+        generated, _ = generated_run
         for code in generated.values():
             assert "DO NOT EDIT" in code
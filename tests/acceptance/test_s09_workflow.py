@@ -16,8 +16,9 @@ from spec_eng.models import ProjectConfig
 pytestmark = pytest.mark.acceptance
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner() -> CliRunner:
+    # invoke() isolates streams per call, so one runner serves the module
     return CliRunner()
 
 
@@ -41,33 +42,28 @@ THEN there is 1 registered user.
     return tmp_path
 
 
+@pytest.fixture(scope="module")
+def status_output(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Output of one `spec-eng status` run in a full project, shared by the 9.1 tests."""
+    proj = _setup_full_project(tmp_path_factory.mktemp("status"))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(proj)
+        result = CliRunner().invoke(cli, ["status"])
+    return result.output
+
+
 class TestScenario9_1:
     """9.1: The status command shows the current state."""
 
-    def test_status_shows_spec_count(
-        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        proj = _setup_full_project(tmp_path)
-        monkeypatch.chdir(proj)
-        result = runner.invoke(cli, ["status"])
-        assert "Spec files:" in result.output
-        assert "1" in result.output
+    def test_status_shows_spec_count(self, status_output: str) -> None:
+        assert "Spec files:" in status_output
+        assert "1" in status_output
 
-    def test_status_shows_scenarios(
-        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        proj = _setup_full_project(tmp_path)
-        monkeypatch.chdir(proj)
-        result = runner.invoke(cli, ["status"])
-        assert "Scenarios:" in result.output
+    def test_status_shows_scenarios(self, status_output: str) -> None:
+        assert "Scenarios:" in status_output
 
-    def test_status_shows_pipeline(
-        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        proj = _setup_full_project(tmp_path)
-        monkeypatch.chdir(proj)
-        result = runner.invoke(cli, ["status"])
-        assert "Pipeline:" in result.output
+    def test_status_shows_pipeline(self, status_output: str) -> None:
+        assert "Pipeline:" in status_output
 
 
 class TestScenario9_3:
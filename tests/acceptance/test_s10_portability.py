@@ -9,7 +9,7 @@ import pytest
 
 from spec_eng.config import save_config
 from spec_eng.generator import generate_tests
-from spec_eng.models import ProjectConfig
+from spec_eng.models import ParseResult, ProjectConfig
 from spec_eng.parser import parse_gwt_file, parse_gwt_string
 
 pytestmark = pytest.mark.acceptance
@@ -25,20 +25,33 @@ WHEN a user registers.
 THEN there is 1 registered user.
 """
 
+# Programming-language constructs that must never appear in a spec's clauses
+_LANGUAGE_KEYWORDS = (
+    "def ", "class ", "function ", "fn ", "impl ",
+    "import ", "require(", "pub ", "private ",
+)
+
+
+@pytest.fixture(scope="module")
+def sample_result() -> ParseResult:
+    """Parse result of SAMPLE_GWT."""
+    return parse_gwt_string(SAMPLE_GWT)
+
 
 class TestScenario10_1:
     """10.1: The same spec files work across different language targets."""
 
-    def test_spec_parses_regardless_of_target(self, tmp_path: Path) -> None:
+    def test_spec_parses_regardless_of_target(
+        self, tmp_path: Path, sample_result: ParseResult
+    ) -> None:
         # Same spec file parses identically for any language target
         spec_file = tmp_path / "registration.gwt"
         spec_file.write_text(SAMPLE_GWT)
 
-        result_py = parse_gwt_file(spec_file)
-        result_ts = parse_gwt_file(spec_file)
+        result = parse_gwt_file(spec_file)
 
-        assert len(result_py.scenarios) == len(result_ts.scenarios)
-        assert result_py.scenarios[0].title == result_ts.scenarios[0].title
+        assert len(result.scenarios) == len(sample_result.scenarios)
+        assert result.scenarios[0].title == sample_result.scenarios[0].title
 
     def test_different_targets_same_scenarios(self, tmp_path: Path) -> None:
         # Generate tests for python target
@@ -61,33 +74,25 @@ class TestScenario10_1:
 class TestScenario10_2:
     """10.2: Spec files contain no language-specific constructs."""
 
-    def test_spec_no_language_constructs(self) -> None:
+    def test_spec_no_language_constructs(self, sample_result: ParseResult) -> None:
         # GWT specs are pure behavioral language
-        result = parse_gwt_string(SAMPLE_GWT)
-        assert result.is_success
-        scenario = result.scenarios[0]
+        assert sample_result.is_success
+        scenario = sample_result.scenarios[0]
         # No language keywords should be present
         all_text = " ".join(
             c.text for c in scenario.givens + scenario.whens + scenario.thens
         )
-        language_keywords = [
-            "def ", "class ", "function ", "fn ", "impl ",
-            "import ", "require(", "pub ", "private ",
-        ]
-        for kw in language_keywords:
-            assert kw not in all_text
-
-    def test_spec_parses_without_modification(self) -> None:
+        assert not [kw for kw in _LANGUAGE_KEYWORDS if kw in all_text]
+
+    def test_spec_parses_without_modification(self, sample_result: ParseResult) -> None:
         # A spec authored for one project works in another without changes
-        result1 = parse_gwt_string(SAMPLE_GWT)
-        result2 = parse_gwt_string(SAMPLE_GWT)
-        assert result1.scenarios[0].title == result2.scenarios[0].title
-        assert len(result1.scenarios) == len(result2.scenarios)
+        result = parse_gwt_string(SAMPLE_GWT)
+        assert result.scenarios[0].title == sample_result.scenarios[0].title
+        assert len(result.scenarios) == len(sample_result.scenarios)
 
-    def test_gwt_uses_behavioral_language(self) -> None:
+    def test_gwt_uses_behavioral_language(self, sample_result: ParseResult) -> None:
         # Verify the sample spec uses behavioral language only
-        result = parse_gwt_string(SAMPLE_GWT)
-        scenario = result.scenarios[0]
+        scenario = sample_result.scenarios[0]
         # Clauses describe behavior, not implementation
         assert "register" in scenario.whens[0].text.lower()
         assert "registered user" in scenario.thens[0].text.lower()
@@ -59,7 +59,7 @@ class TestScenario11_2:
 class TestScenario11_3:
     """11.3: The tool respects .gitignore patterns."""
 
-    def test_gitignore_advice(self, tmp_path: Path) -> None:
+    def test_gitignore_advice(self, tmp_path: Path, minimal_spec: str) -> None:
         from click.testing import CliRunner
         from spec_eng.cli import cli
 
@@ -67,9 +67,7 @@ class TestScenario11_3:
         config = ProjectConfig(language="python", framework="pytest")
         save_config(config, tmp_path)
         (tmp_path / "specs").mkdir()
-        (tmp_path / "specs" / "test.gwt").write_text(
-            ";===\n; Test.\n;===\nGIVEN a.\n\nWHEN b.\n\nTHEN c.\n"
-        )
+        (tmp_path / "specs" / "test.gwt").write_text(minimal_spec)
 
         import os
 
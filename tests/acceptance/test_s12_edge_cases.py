@@ -99,9 +99,8 @@ class TestScenario12_3:
 class TestScenario12_4:
     """12.4: The tool works without an internet connection."""
 
-    def test_parse_works_offline(self) -> None:
-        content = ";===\n; Test.\n;===\nGIVEN a.\n\nWHEN b.\n\nTHEN c.\n"
-        result = parse_gwt_string(content)
+    def test_parse_works_offline(self, minimal_spec: str) -> None:
+        result = parse_gwt_string(minimal_spec)
         assert result.is_success
 
     def test_graph_works_offline(self) -> None:
@@ -9,36 +9,29 @@ import pytest
 
 from spec_eng.gaps import analyze_gaps
 from spec_eng.graph import build_graph
-from spec_eng.parser import parse_markdown_gwt
+from spec_eng.models import Clause, Gap, GraphModel, ParseResult, Scenario
 
 pytestmark = pytest.mark.acceptance
 
-SPEC_PATH = Path(__file__).parent.parent.parent / "SPEC.md"
-
 
 class TestMetaScenario1:
     """Meta.1: This spec document can be analyzed by the tool it specifies."""
 
-    def test_spec_md_is_parseable(self) -> None:
-        assert SPEC_PATH.exists(), f"SPEC.md not found at {SPEC_PATH}"
-        result = parse_markdown_gwt(SPEC_PATH)
-        assert result.scenarios, "No scenarios extracted from SPEC.md"
+    def test_spec_md_is_parseable(self, spec_path: Path, spec_parse_result: ParseResult) -> None:
+        assert spec_path.exists(), f"SPEC.md not found at {spec_path}"
+        assert spec_parse_result.scenarios, "No scenarios extracted from SPEC.md"
 
-    def test_extracts_at_least_52_scenarios(self) -> None:
-        result = parse_markdown_gwt(SPEC_PATH)
-        assert len(result.scenarios) >= 52, (
-            f"Expected >= 52 scenarios, got {len(result.scenarios)}"
+    def test_extracts_at_least_52_scenarios(self, spec_parse_result: ParseResult) -> None:
+        assert len(spec_parse_result.scenarios) >= 52, (
+            f"Expected >= 52 scenarios, got {len(spec_parse_result.scenarios)}"
         )
 
-    def test_state_machine_from_spec(self) -> None:
-        result = parse_markdown_gwt(SPEC_PATH)
-        gm = build_graph(result)
-        assert len(gm.states) > 0, "No states extracted from SPEC.md"
-        assert len(gm.transitions) > 0, "No transitions extracted"
+    def test_state_machine_from_spec(self, spec_graph_model: GraphModel) -> None:
+        assert len(spec_graph_model.states) > 0, "No states extracted from SPEC.md"
+        assert len(spec_graph_model.transitions) > 0, "No transitions extracted"
 
-    def test_all_sections_represented(self) -> None:
-        result = parse_markdown_gwt(SPEC_PATH)
-        titles = [s.title for s in result.scenarios]
+    def test_all_sections_represented(self, spec_parse_result: ParseResult) -> None:
+        titles = [s.title for s in spec_parse_result.scenarios]
 
         # Check key scenarios from each section are present
         expected_keywords = [
@@ -65,29 +58,21 @@ class TestMetaScenario1:
 class TestMetaScenario2:
     """Meta.2: Gaps found in this spec are addressed."""
 
-    def test_gap_analysis_on_spec(self) -> None:
-        result = parse_markdown_gwt(SPEC_PATH)
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
+    def test_gap_analysis_on_spec(self, spec_gaps: list[Gap]) -> None:
         # Gap analysis should run without error
-        assert isinstance(gaps, list)
+        assert isinstance(spec_gaps, list)
 
-    def test_gap_count_is_finite(self) -> None:
-        result = parse_markdown_gwt(SPEC_PATH)
-        gm = build_graph(result)
-        gaps = analyze_gaps(gm)
+    def test_gap_count_is_finite(self, spec_gaps: list[Gap]) -> None:
         # There may be many gaps in a large spec; just check it's finite
         # 64 scenarios produce many unique states with dead-ends
-        assert len(gaps) < 1000, f"Too many gaps ({len(gaps)}); likely a bug"
+        assert len(spec_gaps) < 1000, f"Too many gaps ({len(spec_gaps)}); likely a bug"
 
-    def test_new_scenario_reduces_gaps(self) -> None:
+    def test_new_scenario_reduces_gaps(
+        self, spec_parse_result: ParseResult, spec_gaps: list[Gap]
+    ) -> None:
         # Simulate: parse SPEC, analyze gaps, then add a scenario
         # that covers a dead-end state, and verify gap count decreases
-        from spec_eng.models import Clause, ParseResult, Scenario
-
-        result = parse_markdown_gwt(SPEC_PATH)
-        gm = build_graph(result)
-        gaps_before = analyze_gaps(gm)
+        gaps_before = spec_gaps
 
         # Find a dead-end state if any exists
         dead_ends = [g for g in gaps_before if g.gap_type.value == "dead_end"]
@@ -107,7 +92,7 @@ class TestMetaScenario2:
         )
 
         extended = ParseResult(
-            scenarios=list(result.scenarios) + [new_scenario]
+            scenarios=list(spec_parse_result.scenarios) + [new_scenario]
         )
         gm2 = build_graph(extended)
         gaps_after = analyze_gaps(gm2)
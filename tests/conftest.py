@@ -6,6 +6,13 @@ from pathlib import Path
 
 import pytest
 
+from spec_eng.gaps import analyze_gaps
+from spec_eng.graph import build_graph
+from spec_eng.models import Gap, GraphModel, ParseResult
+from spec_eng.parser import parse_markdown_gwt
+
+SPEC_PATH = Path(__file__).parent.parent / "SPEC.md"
+
 
 @pytest.fixture
 def tmp_project(tmp_path: Path) -> Path:
@@ -37,6 +44,12 @@ def initialized_project(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def minimal_spec() -> str:
+    """Return the smallest valid spec: one scenario with one GIVEN, WHEN and THEN."""
+    return ";===\n; Test.\n;===\nGIVEN a.\n\nWHEN b.\n\nTHEN c.\n"
+
+
 @pytest.fixture
 def sample_gwt_content() -> str:
     """Return a sample GWT spec string."""
@@ -94,3 +107,27 @@ def sample_gwt_file(tmp_path: Path, sample_gwt_content: str) -> Path:
     gwt_file = specs_dir / "registration.gwt"
     gwt_file.write_text(sample_gwt_content)
     return gwt_file
+
+
+@pytest.fixture(scope="session")
+def spec_path() -> Path:
+    """Path to the project's own SPEC.md."""
+    return SPEC_PATH
+
+
+@pytest.fixture(scope="session")
+def spec_parse_result(spec_path: Path) -> ParseResult:
+    """Parse result of SPEC.md, shared by the session."""
+    return parse_markdown_gwt(spec_path)
+
+
+@pytest.fixture(scope="session")
+def spec_graph_model(spec_parse_result: ParseResult) -> GraphModel:
+    """State machine graph of SPEC.md, built once per session."""
+    return build_graph(spec_parse_result)
+
+
+@pytest.fixture(scope="session")
+def spec_gaps(spec_graph_model: GraphModel) -> list[Gap]:
+    """Gap analysis of the SPEC.md graph, run once per session."""
+    return analyze_gaps(spec_graph_model)
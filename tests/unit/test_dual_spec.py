@@ -162,3 +162,51 @@ def test_spec_check_flags_banned_tokens_and_regex(tmp_path: Path, repo_root: Pat
     assert any("UserService" in v.matched for v in violations)
     assert any("POST" in v.matched or "/api/" in v.matched for v in violations)
     assert any(v.suggestion for v in violations)
+
+
+def test_spec_check_streams_large_files_with_correct_lines(
+    tmp_path: Path, repo_root: Path
+) -> None:
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir(parents=True)
+    shutil.copy(repo_root / "specs" / "vocab.yaml", specs_dir / "vocab.yaml")
+
+    filler = "GIVEN a registered user.\n" * 4000
+    big = specs_dir / "big.txt"
+    big.write_text(filler + "GIVEN the UserService is empty.\n")
+    assert big.stat().st_size > 64 * 1024
+
+    vocab = load_vocab(specs_dir / "vocab.yaml")
+    violations = check_specs(specs_dir, vocab)
+
+    assert any(v.matched == "UserService" and v.line == 4001 for v in violations)
+
+
+def test_compile_spec_accepts_canonical_input_unchanged(tmp_path: Path, repo_root: Path) -> None:
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir(parents=True)
+    shutil.copy(repo_root / "specs" / "vocab.yaml", specs_dir / "vocab.yaml")
+    shutil.copy(repo_root / "tests" / "fixtures" / "dual-spec-sample.txt", specs_dir / "sample.txt")
+
+    vocab = load_vocab(specs_dir / "vocab.yaml")
+    first = compile_spec(specs_dir / "sample.txt", vocab, project_root=tmp_path)
+    shutil.copy(first["canonical_gwt"], specs_dir / "again.txt")
+
+    second = compile_spec(specs_dir / "again.txt", vocab, project_root=tmp_path)
+
+    assert second["diff"].read_text() == "No textual differences.\n"
+    assert second["canonical_gwt"].read_text() == first["canonical_gwt"].read_text()
+
+
+def test_spec_check_line_numbers_ignore_form_feeds(tmp_path: Path, repo_root: Path) -> None:
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir(parents=True)
+    shutil.copy(repo_root / "specs" / "vocab.yaml", specs_dir / "vocab.yaml")
+    (specs_dir / "small.txt").write_text(
+        "GIVEN a user.\x0cStill line one.\nGIVEN the UserService is empty.\n", encoding="utf-8"
+    )
+
+    vocab = load_vocab(specs_dir / "vocab.yaml")
+    violations = check_specs(specs_dir, vocab)
+
+    assert any(v.matched == "UserService" and v.line == 2 for v in violations)
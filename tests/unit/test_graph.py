@@ -7,6 +7,7 @@ import pytest
 from spec_eng.exporters.dot import export_dot
 from spec_eng.exporters.json_export import export_json
 from spec_eng.graph import (
+    _cached_networkx,
     build_graph,
     extract_states_and_transitions,
     find_semantic_equivalences,
@@ -175,6 +176,28 @@ class TestIncrementalUpdate:
         updated = update_graph_incremental(existing, new_scenarios, "new.gwt")
         assert len(updated.transitions) == 3
 
+    def test_detects_cycle_introduced_by_update(self) -> None:
+        existing = build_graph(ParseResult(
+            scenarios=[_make_scenario("S1", "a", "e1", "b")]
+        ))
+        assert existing.cycles == []
+        updated = update_graph_incremental(
+            existing, [_make_scenario("S2", "b", "e2", "a")], "new.gwt"
+        )
+        assert updated.cycles == [["a", "b"]]
+
+    def test_replacing_scenario_removes_cycle(self) -> None:
+        existing = build_graph(ParseResult(scenarios=[
+            _make_scenario("S1", "a", "e1", "b"),
+            _make_scenario("S2", "b", "e2", "a"),
+        ]))
+        assert existing.cycles
+        updated = update_graph_incremental(
+            existing, [_make_scenario("S2", "b", "e2", "c")], "new.gwt"
+        )
+        assert updated.cycles == []
+        assert to_networkx(updated).edges == _cached_networkx(updated).edges
+
 
 class TestExports:
     def test_dot_export(self) -> None:
@@ -226,3 +249,47 @@ class TestExports:
         assert "S1" in data["states"]["no users"]["source_scenarios"]
         # Transitions have source references
         assert data["transitions"][0]["source_scenario"] == "S1"
+
+
+class TestCycleDetection:
+    def test_self_loop_is_a_cycle(self) -> None:
+        pr = ParseResult(scenarios=[_make_scenario("Loop", "idle", "tick", "idle")])
+        gm = build_graph(pr)
+        assert gm.cycles == [["idle"]]
+
+    def test_acyclic_graph_has_no_cycles(self) -> None:
+        pr = ParseResult(scenarios=[
+            _make_scenario("S1", "a", "go", "b"),
+            _make_scenario("S2", "b", "go", "c"),
+        ])
+        assert build_graph(pr).cycles == []
+
+    def test_cycles_are_sorted(self) -> None:
+        pr = ParseResult(scenarios=[
+            _make_scenario("S1", "y", "go", "z"),
+            _make_scenario("S2", "z", "back", "y"),
+            _make_scenario("S3", "b", "go", "c"),
+            _make_scenario("S4", "c", "back", "b"),
+            _make_scenario("S5", "c", "on", "a"),
+            _make_scenario("S6", "a", "on", "b"),
+        ])
+        assert build_graph(pr).cycles == [["a", "b", "c"], ["b", "c"], ["y", "z"]]
+
+    def test_detect_cycles_disabled(self) -> None:
+        pr = ParseResult(scenarios=[
+            _make_scenario("S1", "a", "go", "b"),
+            _make_scenario("S2", "b", "back", "a"),
+        ])
+        assert build_graph(pr).cycles == [["a", "b"]]
+        assert build_graph(pr, detect_cycles=False).cycles == []
+
+    def test_existing_graph_left_unchanged(self) -> None:
+        existing = build_graph(ParseResult(
+            scenarios=[_make_scenario("S1", "a", "e1", "b")]
+        ))
+        update_graph_incremental(existing, [_make_scenario("S1", "a", "e1", "c")], "new.gwt")
+        again = update_graph_incremental(
+            existing, [_make_scenario("S2", "b", "e2", "a")], "new.gwt"
+        )
+        assert set(_cached_networkx(existing).edges) == {("a", "b")}
+        assert again.cycles == [["a", "b"]]
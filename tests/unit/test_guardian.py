@@ -2,7 +2,7 @@
 
 import pytest
 
-from spec_eng.guardian import analyze_clause, analyze_file, analyze_scenario
+from spec_eng.guardian import PATTERNS, analyze_clause, analyze_file, analyze_scenario
 from spec_eng.models import Clause, Scenario
 
 
@@ -71,6 +71,13 @@ class TestAnalyzeClause:
         # Allowlist should suppress the API-related warning
         assert len(w2) <= len(w1)
 
+    def test_allowlist_is_case_insensitive_substring(self) -> None:
+        clause = Clause("GIVEN", "the Redis cache is empty", 1)
+        warnings = analyze_clause(clause, allowlist=["redis"])
+        flagged = [t for w in warnings for t in w.flagged_terms]
+        assert "Redis" not in flagged
+        assert "cache" in flagged
+
     def test_low_sensitivity_fewer_warnings(self) -> None:
         clause = Clause("GIVEN", "the cache is empty", 1)
         w_medium = analyze_clause(clause, sensitivity="medium")
@@ -94,6 +101,51 @@ class TestAnalyzeClause:
         suggestions = [w.suggested_alternative for w in warnings]
         assert any("user" in s.lower() or "behavioral" in s.lower() for s in suggestions)
 
+    def test_term_matched_by_several_patterns_flagged_once(self) -> None:
+        clause = Clause("GIVEN", "the UserService has no users", 1)
+        warnings = analyze_clause(clause)
+        class_warnings = [w for w in warnings if w.category == "class_name"]
+        assert [w.flagged_terms for w in class_warnings] == [["UserService"]]
+
+    def test_mutating_warnings_does_not_affect_later_calls(self) -> None:
+        clause = Clause("GIVEN", "the UserService has no users", 1)
+        for w in analyze_clause(clause):
+            w.flagged_terms.append("extra")
+        assert all("extra" not in w.flagged_terms for w in analyze_clause(clause))
+
+    @pytest.mark.parametrize("category", ["database", "framework"])
+    def test_literal_categories_agree_with_patterns(self, category: str) -> None:
+        text = "the Redis cache, users TABLE and rows2 via SQL sql queue MongoDB schema"
+        clause = Clause("GIVEN", text, 1)
+        flagged = [
+            t for w in analyze_clause(clause) if w.category == category for t in w.flagged_terms
+        ]
+        per_pattern = [m.group(0) for p, _ in PATTERNS[category] for m in p.finditer(text)]
+        assert flagged == per_pattern
+
+    @pytest.mark.parametrize(
+        ("text", "term"),
+        [
+            ("a GET to /api/endpoint returns HTTP status code 200", "endpoint"),
+            ("/api/HTTP endpoint", "HTTP"),
+        ],
+    )
+    def test_overlapping_matches_from_different_patterns_kept(
+        self, text: str, term: str
+    ) -> None:
+        warnings = analyze_clause(Clause("WHEN", text, 1))
+        assert term in [t for w in warnings for t in w.flagged_terms]
+
+    def test_literal_warnings_follow_pattern_order(self) -> None:
+        clause = Clause("THEN", "the row is in the table", 1)
+        flagged = [t for w in analyze_clause(clause) for t in w.flagged_terms]
+        assert flagged == ["table", "row"]
+
+    def test_warnings_follow_pattern_order(self) -> None:
+        clause = Clause("WHEN", "an HTTP call to the endpoint at /api/users", 1)
+        flagged = [t for w in analyze_clause(clause) for t in w.flagged_terms]
+        assert flagged == ["/api/users", "endpoint", "HTTP"]
+
 
 class TestAnalyzeScenario:
     def test_analyzes_all_clauses(self) -> None:
@@ -107,6 +159,19 @@ class TestAnalyzeScenario:
         categories = {w.category for w in warnings}
         assert len(categories) >= 2  # Multiple categories flagged
 
+    def test_repeated_clause_warned_once(self) -> None:
+        scenario = Scenario(
+            title="Test",
+            givens=[
+                Clause("GIVEN", "the Redis cache is empty", 1),
+                Clause("GIVEN", "the Redis cache is empty", 2),
+            ],
+            whens=[Clause("WHEN", "a user registers", 3)],
+            thens=[Clause("THEN", "there is 1 registered user", 5)],
+        )
+        warnings = analyze_scenario(scenario)
+        assert len(warnings) == len(analyze_clause(scenario.givens[0]))
+
     def test_clean_scenario_no_warnings(self) -> None:
         scenario = Scenario(
             title="Test",
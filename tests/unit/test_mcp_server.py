@@ -84,6 +84,13 @@ class TestParseGwt:
         assert result["is_success"] is True
         assert result["scenario_count"] == 1
 
+    def test_parse_from_edited_file_is_not_stale(self, tmp_path: Path) -> None:
+        f = tmp_path / "test.gwt"
+        f.write_text(SAMPLE_GWT)
+        assert _parse_gwt(file_path=str(f))["scenario_count"] == 1
+        f.write_text(MULTI_GWT)
+        assert _parse_gwt(file_path=str(f))["scenario_count"] == 3
+
     def test_parse_no_input(self) -> None:
         result = _parse_gwt()
         assert "error" in result
@@ -249,3 +256,14 @@ class TestGetProjectStatus:
         assert result["scenario_count"] == 3
         assert result["states"] > 0
         assert result["transitions"] > 0
+
+    def test_reflects_spec_changes_between_calls(self, tmp_path: Path) -> None:
+        specs_dir = tmp_path / "specs"
+        specs_dir.mkdir()
+        (specs_dir / "auth.gwt").write_text(MULTI_GWT)
+        assert _get_project_status(project_root=str(tmp_path))["scenario_count"] == 3
+
+        (specs_dir / "register.gwt").write_text(SAMPLE_GWT)
+        result = _get_project_status(project_root=str(tmp_path))
+        assert result["spec_files"] == 2
+        assert result["scenario_count"] == 4
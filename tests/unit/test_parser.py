@@ -4,7 +4,14 @@ from pathlib import Path
 
 import pytest
 
-from spec_eng.parser import Lexer, Parser, TokenType, parse_gwt_file, parse_gwt_string
+from spec_eng.parser import (
+    Lexer,
+    Parser,
+    TokenType,
+    parse_gwt_file,
+    parse_gwt_string,
+    parse_markdown_gwt,
+)
 
 
 # ── Lexer Tests ──────────────────────────────────────────────────────
@@ -239,3 +246,43 @@ THEN a welcome email is sent.
         assert result.is_success
         assert len(result.scenarios) == 1
         assert result.scenarios[0].source_file == str(sample_gwt_file)
+
+    @pytest.mark.parametrize("newline", ["\r\n", "\r"])
+    def test_parse_file_with_non_unix_newlines(
+        self, tmp_path: Path, sample_gwt_content: str, newline: str
+    ) -> None:
+        path = tmp_path / "windows.gwt"
+        path.write_bytes(sample_gwt_content.replace("\n", newline).encode("utf-8"))
+        result = parse_gwt_file(path)
+        assert result.is_success
+        assert result.scenarios[0].thens[0].line_number == 8
+
+
+# ── Markdown Tests ───────────────────────────────────────────────────
+
+
+class TestParseMarkdown:
+    def test_skips_header_blocks_without_clauses(self, tmp_path: Path) -> None:
+        md = tmp_path / "SPEC.md"
+        md.write_text("""\
+# Spec
+
+;===============================================================
+; Not a scenario.
+;===============================================================
+Just prose after a header.
+
+    ;===============================================================
+    ; Indented scenario.
+    ;===============================================================
+    GIVEN no users.
+
+    WHEN a user registers.
+
+    THEN there is 1 user.
+
+More prose.
+""")
+        result = parse_markdown_gwt(md)
+        assert result.is_success
+        assert [s.title for s in result.scenarios] == ["Indented scenario."]
@@ -1,11 +1,18 @@
 """Unit tests for spec_eng.runner."""
 
+import os
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from spec_eng.runner import TestResult, _parse_pytest_output, run_acceptance_tests, run_verify
+from spec_eng.runner import (
+    TestResult,
+    _parse_pytest_output,
+    _regenerate_if_stale,
+    run_acceptance_tests,
+    run_verify,
+)
 
 
 class TestTestResult:
@@ -63,6 +70,39 @@ class TestRunAcceptanceTests:
         assert "No generated tests" in result.output
 
 
+class TestRegenerateIfStale:
+    def test_only_stale_specs_are_regenerated(self, tmp_path: Path, minimal_spec: str) -> None:
+        specs_dir = tmp_path / "specs"
+        specs_dir.mkdir()
+        gen_dir = tmp_path / ".spec-eng" / "generated"
+        gen_dir.mkdir(parents=True)
+        (specs_dir / "fresh.gwt").write_text(minimal_spec)
+        (specs_dir / "stale.gwt").write_text(minimal_spec)
+        (gen_dir / "test_fresh.py").write_text("# untouched\n")
+        (gen_dir / "test_stale.py").write_text("# outdated\n")
+        os.utime(gen_dir / "test_stale.py", (0, 0))
+
+        _regenerate_if_stale(tmp_path, specs_dir, gen_dir)
+
+        assert (gen_dir / "test_fresh.py").read_text() == "# untouched\n"
+        assert "DO NOT EDIT" in (gen_dir / "test_stale.py").read_text()
+
+    def test_many_stale_specs_all_regenerated(self, tmp_path: Path) -> None:
+        specs_dir = tmp_path / "specs"
+        specs_dir.mkdir()
+        gen_dir = tmp_path / ".spec-eng" / "generated"
+        gen_dir.mkdir(parents=True)
+        for i in range(5):
+            (specs_dir / f"spec{i}.gwt").write_text(
+                f";===\n; Scenario {i}.\n;===\nGIVEN a.\n\nWHEN b.\n\nTHEN c.\n"
+            )
+
+        _regenerate_if_stale(tmp_path, specs_dir, gen_dir)
+
+        for i in range(5):
+            assert f"Scenario {i}" in (gen_dir / f"test_spec{i}.py").read_text()
+
+
 class TestRunVerify:
     def test_warns_no_unit_tests(self, tmp_path: Path) -> None:
         # Create generated tests
@@ -73,3 +113,26 @@ class TestRunVerify:
         )
         result = run_verify(tmp_path)
         assert "Unit" in result.output or "unit" in result.output.lower()
+
+    def test_regenerates_before_either_run_starts(
+        self, tmp_path: Path, minimal_spec: str
+    ) -> None:
+        specs_dir = tmp_path / "specs"
+        specs_dir.mkdir()
+        (specs_dir / "stale.gwt").write_text(minimal_spec)
+        (tmp_path / "tests").mkdir()
+        gen_file = tmp_path / ".spec-eng" / "generated" / "test_stale.py"
+        gen_file.parent.mkdir(parents=True)
+        gen_file.write_text("# outdated\n")
+        os.utime(gen_file, (0, 0))
+        seen: list[str] = []
+
+        def fake_run(test_path: Path) -> TestResult:
+            seen.append(gen_file.read_text())
+            return TestResult(passed=1)
+
+        with patch("spec_eng.runner._run_pytest", side_effect=fake_run):
+            run_verify(tmp_path)
+
+        assert len(seen) == 2
+        assert all("DO NOT EDIT" in content for content in seen)
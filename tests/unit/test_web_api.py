@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import http.client
 import json
 import socket
 import shutil
 import threading
+import urllib.error
 import urllib.request
+from collections.abc import Iterator
 from http.server import ThreadingHTTPServer
 from pathlib import Path
 
+import pytest
+
 from spec_eng.web_api import WorkflowHandler
 
 
@@ -31,8 +36,9 @@ def _request(method: str, url: str, payload: dict | None = None) -> dict:
         return json.loads(resp.read().decode("utf-8"))
 
 
-def test_web_api_health_compile_and_interrogate(tmp_path: Path) -> None:
-    _setup_project(tmp_path)
+@pytest.fixture
+def server_address(tmp_path: Path) -> Iterator[tuple[str, int]]:
+    """A workflow API server rooted at tmp_path, as (host, port)."""
     host = "127.0.0.1"
     sock = socket.socket()
     sock.bind((host, 0))
@@ -44,30 +50,66 @@ def test_web_api_health_compile_and_interrogate(tmp_path: Path) -> None:
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     try:
-        health = _request("GET", f"http://{host}:{port}/health")
-        assert health["ok"] is True
-
-        compiled = _request(
-            "POST",
-            f"http://{host}:{port}/compile",
-            {"input_path": "specs/sample.txt"},
-        )
-        assert compiled["ok"] is True
-
-        interrogated = _request(
-            "POST",
-            f"http://{host}:{port}/interrogate",
-            {
-                "idea": "Checkout",
-                "answers": [
-                    "success_criteria=user can checkout",
-                    "failure_case=declined card is rejected",
-                    "constraints=checkout under 2 minutes",
-                ],
-            },
-        )
-        assert interrogated["ok"] is True
-        assert interrogated["session"]["iteration"] == 1
+        yield host, port
     finally:
         server.shutdown()
         server.server_close()
+
+
+def test_web_api_health_compile_and_interrogate(
+    tmp_path: Path, server_address: tuple[str, int]
+) -> None:
+    _setup_project(tmp_path)
+    host, port = server_address
+    health = _request("GET", f"http://{host}:{port}/health")
+    assert health["ok"] is True
+
+    compiled = _request(
+        "POST",
+        f"http://{host}:{port}/compile",
+        {"input_path": "specs/sample.txt"},
+    )
+    assert compiled["ok"] is True
+
+    interrogated = _request(
+        "POST",
+        f"http://{host}:{port}/interrogate",
+        {
+            "idea": "Checkout",
+            "answers": [
+                "success_criteria=user can checkout",
+                "failure_case=declined card is rejected",
+                "constraints=checkout under 2 minutes",
+            ],
+        },
+    )
+    assert interrogated["ok"] is True
+    assert interrogated["session"]["iteration"] == 1
+
+
+def test_web_api_reports_missing_required_field(server_address: tuple[str, int]) -> None:
+    host, port = server_address
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        _request("POST", f"http://{host}:{port}/check", {})
+    assert excinfo.value.code == 400
+    body = json.loads(excinfo.value.read().decode("utf-8"))
+    assert body == {"ok": False, "error": "Missing required field(s): input_path"}
+
+
+def test_web_api_reuses_connection_across_requests(server_address: tuple[str, int]) -> None:
+    host, port = server_address
+    conn = http.client.HTTPConnection(host, port, timeout=5)
+    try:
+        conn.request("POST", "/unknown", body=b'{"ignored": true}')
+        missing = conn.getresponse()
+        assert missing.status == 404
+        missing.read()
+        first_sock = conn.sock
+
+        conn.request("GET", "/health")
+        health = conn.getresponse()
+        assert health.status == 200
+        assert json.loads(health.read())["ok"] is True
+        assert conn.sock is first_sock
+    finally:
+        conn.close()
@@ -5,7 +5,7 @@ from __future__ import annotations
 import shutil
 from pathlib import Path
 
-from spec_eng.workflow_mcp import _interrogate, _spec_check, _spec_compile
+from spec_eng.workflow_mcp import _interrogate, _load_vocab_for_root, _spec_check, _spec_compile
 
 
 def _setup_project(tmp_path: Path) -> None:
@@ -47,3 +47,13 @@ def test_interrogate_helper(tmp_path: Path) -> None:
     )
     assert result["ok"] is True
     assert result["session"]["iteration"] == 1
+
+
+def test_vocab_is_reloaded_after_edit(tmp_path: Path) -> None:
+    _setup_project(tmp_path)
+    first = _load_vocab_for_root(tmp_path)
+    assert _load_vocab_for_root(tmp_path) is first
+
+    vocab_path = tmp_path / "specs" / "vocab.yaml"
+    vocab_path.write_text(vocab_path.read_text() + "\n# edited\n")
+    assert _load_vocab_for_root(tmp_path) is not first